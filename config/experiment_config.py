@@ -91,6 +91,13 @@ class ExperimentConfig:
             'min_phi_value': self.MIN_PHI_VALUE,
         }
 
+        # whether to torch.compile the model's forward in place (default mode) before
+        # generation, so generate's decode loop runs the compiled graph. Amortizes
+        # per-decode-step Python/dispatch overhead at the cost of a one-off compilation
+        # per input shape. reduce-overhead is deliberately not used: its CUDA-graph
+        # capture requires a static KV cache, which generate does not use here
+        self.COMPILE_MODEL: bool = kwargs.get('COMPILE_MODEL', False)
+
         # minimum of new tokens to generate
         self.MIN_NEW_TOKENS: int = kwargs.get('MIN_NEW_TOKENS', 1)
         # maximum of new tokens to generate
@@ -235,13 +235,13 @@ def generate_newts_summaries_with_steering_and_prompting(
         with torch.no_grad():
             for article_index in range(min(len(dataset), num_articles)):
                 article_data = dataset[article_index]
-                article_idx = int(article_data['article_idx']) 
-                docId = article_data['docId']
-                article = article_data['article']
-                tid1 = article_data['tid1']
-                tid2 = article_data['tid2']
-                summary1 = article_data['summary1']
-                summary2 = article_data['summary2']
+                article_idx = int(article_data.article_idx)
+                docId = article_data.docId
+                article = article_data.article
+                tid1 = article_data.tid1
+                tid2 = article_data.tid2
+                summary1 = article_data.summary1
+                summary2 = article_data.summary2
                 
                 # Get prompts for different steering strengths
                 prompts = {
@@ -6,21 +6,24 @@ During generation, the model is steered towards a specific behavior using a stee
 
 # Standard library imports
 import os
-import json
 import logging
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime
 from typing import List, Dict, Union, Any
 
 # Third-party imports
 import torch
-import numpy as np
+import orjson
 from steering_vectors import SteeringVector
 
 # Local imports
 from config.experiment_config import ExperimentConfig
 from src.utils.load_models_and_tokenizers import load_model_and_tokenizer
 from src.train_vectors.get_steering_vector import get_steering_vector
-from src.utils import generate_text_with_steering_vector
+from src.utils import generate_texts_with_steering_vector_batched
 from src.utils.get_prompt import get_newts_summary_prompt
 from src.utils.load_datasets import load_newts_dataframe, NEWTSDataset
 
@@ -29,17 +32,19 @@ logging.basicConfig(level=logging.INFO,
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# Custom JSON encoder to handle numpy types
-class NumpyEncoder(json.JSONEncoder):
-    '''Custom JSON encoder to handle numpy types.'''
-    def default(self, o):
-        if isinstance(o, np.integer):
-            return int(o)
-        if isinstance(o, np.floating):
-            return float(o)
-        if isinstance(o, np.ndarray):
-            return o.tolist()
-        return super(NumpyEncoder, self).default(o)
+# Serializes appends to the NDJSON shard across the finalize worker threads
+_SHARD_WRITE_LOCK = threading.Lock()
+
+def _finalize_article(summary_entry: Dict[str, Any], shard_path: str) -> None:
+    """
+    Encodes one article's summary entry and appends it as one NDJSON line to
+    the shard file. Runs on a background thread: orjson.dumps and the file
+    write both release the GIL, so this bookkeeping overlaps with the next
+    article's generation on the GPU.
+    """
+    line = orjson.dumps(summary_entry) + b"\n"
+    with _SHARD_WRITE_LOCK, open(shard_path, 'ab') as f:
+        f.write(line)
 
 def generate_newts_summaries(
     config: ExperimentConfig,
@@ -78,11 +83,31 @@ def generate_newts_summaries(
     tokenizer, model, device = load_model_and_tokenizer(model_alias=model_alias)
     max_new_tokens = config.MAX_NEW_TOKENS
     model.eval()
-    
+
+    if config.COMPILE_MODEL:
+        # Compile the forward in place so generate's decode loop hits the
+        # compiled graph: wrapping the module (`model = torch.compile(model)`)
+        # leaves model.generate bound to the original module, whose internal
+        # self(...) calls would run the uncompiled forward. Default mode is
+        # used because reduce-overhead's CUDA-graph capture requires a static
+        # KV cache, which generate does not use here. The first call per input
+        # shape pays the compilation cost, so warm up once before the article loop.
+        logger.info("Compiling model forward with torch.compile...")
+        model.forward = torch.compile(model.forward, fullgraph=False)
+        warmup_inputs = tokenizer("Warm-up prompt.", return_tensors="pt").to(device)
+        with torch.no_grad():
+            model.generate(**warmup_inputs, max_new_tokens=8,
+                           pad_token_id=tokenizer.pad_token_id if tokenizer.pad_token_id is not None
+                           else tokenizer.eos_token_id)
+        logger.info("Model compilation warm-up finished.")
+
     # Load the dataset directly as a DataFrame instead of using a DataLoader with batching
     df = load_newts_dataframe(num_articles=num_articles, load_test_set=False)
     dataset = NEWTSDataset(dataframe=df)
 
+    num_articles_to_process = min(len(dataset), num_articles)
+    article_order = list(range(num_articles_to_process))
+
     if behavior_type != "topic":
         steering_vector: SteeringVector = get_steering_vector(
             behavior_type=behavior_type,
@@ -97,6 +122,45 @@ def generate_newts_summaries(
     else:
         steering_vector = None
 
+    @functools.lru_cache(maxsize=None)
+    def _cached_topic_vector(tid: int) -> SteeringVector:
+        return get_steering_vector(
+            behavior_type="topic",
+            model_alias=model_alias,
+            representation_type=representation_type,
+            num_samples=num_samples,
+            steering_layers=steering_layers,
+            language=language,
+            pairing_type=pairing_type,
+            tid=tid
+        )
+
+    # Build and tokenize every prompt once, recording its token length so
+    # articles can be processed from shortest to longest prompt. The cached
+    # tensors are pinned on CUDA hosts so the per-article device copy can run
+    # asynchronously, and generation never re-tokenizes the same prompt
+    prompts: Dict[int, str] = {}
+    prompt_encodings: Dict[int, Any] = {}
+    prompt_token_lengths: Dict[int, int] = {}
+    for article_index in article_order:
+        prompt = get_newts_summary_prompt(article=dataset[article_index].article,
+                                          behavior_type=behavior_type,
+                                          use_behavior_encouraging_prompt=use_behavior_encouraging_prompt)
+        encoding = tokenizer(prompt, return_tensors="pt", truncation=True)
+        if device.type == "cuda":
+            encoding["input_ids"] = encoding["input_ids"].pin_memory()
+            encoding["attention_mask"] = encoding["attention_mask"].pin_memory()
+        prompts[article_index] = prompt
+        prompt_encodings[article_index] = encoding
+        prompt_token_lengths[article_index] = encoding["input_ids"].shape[1]
+
+    if behavior_type == "topic":
+        # Keep articles grouped by tid1 so the memoized topic vector stays hot,
+        # and order by prompt length within each topic group
+        article_order.sort(key=lambda idx: (int(df['tid1'].iloc[idx]), prompt_token_lengths[idx]))
+    else:
+        article_order.sort(key=lambda idx: prompt_token_lengths[idx])
+
     experiment_information = {
         "model_alias":         model_alias,
         "behavior_type":       behavior_type,
@@ -114,64 +178,92 @@ def generate_newts_summaries(
     }
 
     results: Dict[str, Any] = {"experiment_information": experiment_information}
-    generated_summaries: Dict[str, Dict[str, Any]]  = {}
-    
+    # Column-oriented (SoA) results container: appending to flat per-field lists
+    # avoids allocating one nested dict per article during long runs; the rows
+    # are only transposed back to the JSON shape when saving
+    generated_summaries: Dict[str, Any] = {
+        'article_idx': [], 'docId': [], 'article': [], 'tid1': [], 'tid2': [],
+        'summary1': [], 'summary2': [], 'prompt': [],
+        'summaries_by_strength': {str(strength): [] for strength in config.STEERING_STRENGTHS},
+    }
+
+    # Each finished article is also mirrored to an NDJSON shard so a crashed
+    # run keeps its completed articles. The encode + append runs on a small
+    # background pool and overlaps with the next article's GPU generation
+    shard_dir = os.path.join(os.getenv("NEWTS_SUMMARIES_PATH"), f"{behavior_type}_vectors")
+    os.makedirs(shard_dir, exist_ok=True)
+    shard_filename = (f"{behavior_type}_summaries_{model_alias}_"
+                      f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson")
+    shard_path = os.path.join(shard_dir, shard_filename)
+    finalize_executor = ThreadPoolExecutor(max_workers=2)
+
+    # inference_mode is cheaper than no_grad (no version-counter bookkeeping) and
+    # bf16 autocast halves the activation bandwidth of the memory-bound decoder.
+    # Pre-Ampere GPUs have no bf16 support and torch.autocast would raise, so
+    # mirror the dtype guard used when loading the model and fall back to fp16
+    if device.type == "cuda" and torch.cuda.is_bf16_supported():
+        autocast_context = torch.autocast(device_type="cuda", dtype=torch.bfloat16)
+    elif device.type == "cuda":
+        autocast_context = torch.autocast(device_type="cuda", dtype=torch.float16)
+    else:
+        autocast_context = nullcontext()
     try:
-        with torch.no_grad():
-            for article_index in range(min(len(dataset), num_articles)):
+        with torch.inference_mode(), autocast_context:
+            for article_index in article_order:
                 article_data = dataset[article_index]
-                article_idx = int(article_data['article_idx']) 
-                docId = article_data['docId']
-                article = article_data['article']
-                tid1 = article_data['tid1']
-                tid2 = article_data['tid2']
-                summary1 = article_data['summary1']
-                summary2 = article_data['summary2']
-                
-                prompt = get_newts_summary_prompt(article=article,
-                                                  behavior_type=behavior_type,
-                                                  use_behavior_encouraging_prompt=use_behavior_encouraging_prompt)
-                summary_entry: Dict[str, Any] = {
-                    'docId': docId,
+                article_idx = int(article_data.article_idx)
+                tid1 = article_data.tid1
+                prompt = prompts[article_index]
+
+                if behavior_type == "topic":
+                    steering_vector = _cached_topic_vector(int(tid1))
+
+                # Generate summaries for all steering strengths in one batched call
+                try:
+                    summaries = generate_texts_with_steering_vector_batched(
+                        model=model, tokenizer=tokenizer,
+                        prompt=prompt_encodings[article_index],
+                        steering_vector=steering_vector,
+                        steering_strengths=config.STEERING_STRENGTHS,
+                        device=device, max_new_tokens=max_new_tokens)
+                except Exception as e:
+                    logger.error(f"Error generating summaries for article {article_idx}: {str(e)}")
+                    summaries = [f"Error: {str(e)}"] * len(config.STEERING_STRENGTHS)
+
+                # Coerce pandas/numpy scalars to builtins here so serialization
+                # never needs a per-value type-dispatch fallback
+                generated_summaries['article_idx'].append(article_idx)
+                generated_summaries['docId'].append(str(article_data.docId))
+                generated_summaries['article'].append(article_data.article)
+                generated_summaries['tid1'].append(int(tid1))
+                generated_summaries['tid2'].append(int(article_data.tid2))
+                generated_summaries['summary1'].append(article_data.summary1)
+                generated_summaries['summary2'].append(article_data.summary2)
+                generated_summaries['prompt'].append(prompt)
+                for strength, summary in zip(config.STEERING_STRENGTHS, summaries):
+                    generated_summaries['summaries_by_strength'][str(strength)].append(summary)
+
+                # Hand the finished article to the background writer and move
+                # straight on to the next article's generation
+                summary_entry = {
+                    'docId': str(article_data.docId),
                     'article_idx': article_idx,
-                    'article': article,
-                    'tid1': tid1,
-                    'tid2': tid2,
-                    'summary1': summary1,
-                    'summary2': summary2,
+                    'article': article_data.article,
+                    'tid1': int(tid1),
+                    'tid2': int(article_data.tid2),
+                    'summary1': article_data.summary1,
+                    'summary2': article_data.summary2,
                     'prompt': prompt,
-                    'summaries': {}
+                    'summaries': {str(strength): summary
+                                  for strength, summary in zip(config.STEERING_STRENGTHS, summaries)},
                 }
+                finalize_executor.submit(_finalize_article, summary_entry, shard_path)
 
-                if behavior_type == "topic":
-                    steering_vector = get_steering_vector(
-                        behavior_type="topic",
-                        model_alias=model_alias,
-                        representation_type=representation_type,
-                        num_samples=num_samples,
-                        steering_layers=steering_layers,
-                        language=language,
-                        pairing_type=pairing_type,
-                        tid=tid1
-                    )
-                
-                # Generate summaries with different steering strengths
-                for strength in config.STEERING_STRENGTHS:
-                    try:
-                        summary = generate_text_with_steering_vector(
-                            model=model, tokenizer=tokenizer, prompt=prompt,
-                            steering_vector=steering_vector, steering_strength=strength,
-                            device=device, max_new_tokens=max_new_tokens)
-                            
-                        summary_entry['summaries'][str(strength)] = summary
-                    except Exception as e:
-                        logger.error(f"Error generating summary for article {article_idx} with strength {strength}: {str(e)}")
-                        summary_entry['summaries'][str(strength)] = f"Error: {str(e)}"
-                
-                generated_summaries[str(article_idx)] = summary_entry
-                logger.info(f"Completed article {len(generated_summaries)}/{num_articles}")
-        
-        logger.info(f"Generated {len(generated_summaries)} summaries.")
+                logger.info(f"Completed article {len(generated_summaries['article_idx'])}/{num_articles}")
+
+        # Drain the pending shard writes before the final consolidated save
+        finalize_executor.shutdown(wait=True)
+        logger.info(f"Generated {len(generated_summaries['article_idx'])} summaries.")
         results['generated_summaries'] = generated_summaries
         
         # Save results to file
@@ -184,6 +276,28 @@ def generate_newts_summaries(
     except Exception as e:
         logger.error(f"Error generating summaries: {e}")
         raise
+    finally:
+        finalize_executor.shutdown(wait=True)
+
+def _iter_summary_entries(generated_summaries: Dict[str, Any]):
+    """
+    Transposes the column-oriented results container back into
+    (article_idx_str, summary_entry) pairs in the original JSON shape.
+    """
+    summaries_by_strength = generated_summaries['summaries_by_strength']
+    for row_num, article_idx in enumerate(generated_summaries['article_idx']):
+        yield str(article_idx), {
+            'docId': generated_summaries['docId'][row_num],
+            'article_idx': article_idx,
+            'article': generated_summaries['article'][row_num],
+            'tid1': generated_summaries['tid1'][row_num],
+            'tid2': generated_summaries['tid2'][row_num],
+            'summary1': generated_summaries['summary1'][row_num],
+            'summary2': generated_summaries['summary2'][row_num],
+            'prompt': generated_summaries['prompt'][row_num],
+            'summaries': {strength: column[row_num]
+                          for strength, column in summaries_by_strength.items()},
+        }
 
 def _save_results(
     results: Dict[str, Union[Dict[str, Any], List[Dict[str, Any]]]],
@@ -213,8 +327,22 @@ def _save_results(
         filename = f"{behavior_type}_summaries_{model_alias}_{dataset_name}_{num_articles}_articles_{representation_type}_{use_behavior_encouraging_prompt}_{timestamp}.json"
         filepath = os.path.join(NEWTS_SUMMARIES_PATH, f"{behavior_type}_vectors", filename)
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2, cls=NumpyEncoder)
+        # Stream the file record by record with orjson instead of one big
+        # json.dump; all values are builtins by construction so no custom
+        # encoder dispatch is needed, and the per-article writes keep memory
+        # bounded for large runs
+        with open(filepath, 'wb') as f:
+            f.write(b'{"experiment_information": ')
+            f.write(orjson.dumps(results['experiment_information']))
+            f.write(b', "generated_summaries": {')
+            for entry_num, (article_idx_str, summary_entry) in enumerate(
+                    _iter_summary_entries(results['generated_summaries'])):
+                if entry_num > 0:
+                    f.write(b', ')
+                f.write(orjson.dumps(article_idx_str))
+                f.write(b': ')
+                f.write(orjson.dumps(summary_entry))
+            f.write(b'}}')
         logger.info(f"Results saved to {filepath}")
     except Exception as e:
         logger.error(f"Error saving results: {e}")
@@ -20,18 +20,22 @@ Every function generating training samples should take in a tid and a number of
 '''
 # Standard library imports
 import logging
-from typing import Dict, List, Tuple
+from itertools import chain, product, zip_longest
+from typing import Dict, List, Optional, Tuple
 
 # Third-party imports
-import random
+import numpy as np
 from src.utils import load_topic_representations, validate_topic_representation_type, \
     validate_pairing_type, save_topic_vector_training_samples
 from config.experiment_config import ExperimentConfig
 
-# Set up logging 
+# Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Module-level generator for sampling pair indices
+_rng = np.random.default_rng()
+
 def create_all_topic_vector_training_samples(config: ExperimentConfig) -> None:
     '''
     Create all topic vector training samples for all topics and topic representations and for the
@@ -39,13 +43,22 @@ def create_all_topic_vector_training_samples(config: ExperimentConfig) -> None:
     '''
     for topic_representation_type in config.TOPIC_REPRESENTATION_TYPES:
         num_samples = config.TOPIC_REPRESENTATION_TYPE_NUM_SAMPLES[topic_representation_type]
+        # Load the representations and build the round-robin sample order once
+        # per representation type; every tid reuses them instead of recomputing
+        topic_representations = load_topic_representations(topic_representation_type)
+        interleaved_samples = _build_interleaved_samples(topic_representations)
         for tid in config.TOPIC_IDS:
             create_topic_vector_training_samples(topic_representation_type, num_samples, tid,
-                                                 "against_random_topic_representation")
+                                                 "against_random_topic_representation",
+                                                 topic_representations=topic_representations,
+                                                 interleaved_samples=interleaved_samples)
 
 def create_topic_vector_training_samples(topic_representation_type: str, num_samples: int, tid: int,
-                                         pairing_type: str) -> List[Tuple[str, str]]:
-    '''Create num_samples training samples from topic representation type to train topic vector 
+                                         pairing_type: str,
+                                         topic_representations: Optional[Dict[int, List[str]]] = None,
+                                         interleaved_samples: Optional[List[Tuple[int, str]]] = None
+                                         ) -> List[Tuple[str, str]]:
+    '''Create num_samples training samples from topic representation type to train topic vector
     with pairing_type for tid.
 
     :param config: A Config object containing the configuration parameters.
@@ -53,22 +66,45 @@ def create_topic_vector_training_samples(topic_representation_type: str, num_sam
     :param pairing_type: The type of pairing to use.
     :param num_samples: The number of training samples to generate.
     :param tid: The topic id to generate training samples for.
+    :param topic_representations: Optional preloaded topic representations; loaded
+                                  from disk when not provided.
+    :param interleaved_samples: Optional precomputed round-robin sample order from
+                                _build_interleaved_samples; computed when not provided.
     :return: A list of tuples of (positive_prompt, negative_prompt).
     '''
     # validate inputs
     validate_topic_representation_type(topic_representation_type)
     validate_pairing_type(pairing_type)
 
-    topic_representations = load_topic_representations(topic_representation_type)
+    if topic_representations is None:
+        topic_representations = load_topic_representations(topic_representation_type)
 
     training_samples = create_training_pairs(topic_representations[tid], topic_representations,
-                                             tid, num_samples)
+                                             tid, num_samples,
+                                             interleaved_samples=interleaved_samples)
 
     save_topic_vector_training_samples(training_samples, topic_representation_type, pairing_type, tid)
     return training_samples
 
-def create_training_pairs(positive_samples: List[str], all_samples: Dict[int, List[str]], 
-                          tid_positive: int, num_samples: int) -> List[Tuple[str, str]]:
+def _build_interleaved_samples(all_samples: Dict[int, List[str]]) -> List[Tuple[int, str]]:
+    """
+    Round-robin-interleaves the samples of all topics, tagging each sample with
+    its source topic ID. The tagged order is independent of which topic is the
+    positive one, so it can be computed once and shared across all tids: each
+    caller just skips the entries whose source tid is its positive topic.
+
+    :param all_samples: Dictionary of all samples, Key=Topic ID, Value=List of samples.
+    :return: A list of (source_tid, sample) tuples in round-robin order.
+    """
+    tagged_lists = [[(tid, sample) for sample in samples]
+                    for tid, samples in all_samples.items() if samples]
+    return [entry for entry in chain.from_iterable(zip_longest(*tagged_lists))
+            if entry is not None]
+
+def create_training_pairs(positive_samples: List[str], all_samples: Dict[int, List[str]],
+                          tid_positive: int, num_samples: int,
+                          interleaved_samples: Optional[List[Tuple[int, str]]] = None
+                          ) -> List[Tuple[str, str]]:
     """
     Creates training pairs by combining positive samples with negative samples.
     Negative samples are collected in an 'interleaved' order from all
@@ -82,6 +118,8 @@ def create_training_pairs(positive_samples: List[str], all_samples: Dict[int, Li
     :param all_samples: Dictionary of all samples, Key=Topic ID, Value=List of samples.
     :param tid_positive: The ID of the positive topic.
     :param num_samples: The desired number of training pairs.
+    :param interleaved_samples: Optional precomputed round-robin sample order from
+                                _build_interleaved_samples; computed when not provided.
 
     :return: A list of (positive_sample, negative_sample) tuples.
 
@@ -90,45 +128,44 @@ def create_training_pairs(positive_samples: List[str], all_samples: Dict[int, Li
     """
 
     # --- 1. Collect negative samples in an interleaved order ---
-    negative_lists = [
-        negs for tid, negs in all_samples.items()
-        if tid != tid_positive and negs # Only consider topics with actual samples
-    ]
+    # The round-robin order is shared across all positive topics, so callers
+    # iterating over many tids precompute it once; the positive topic's own
+    # samples are filtered out here via the source-tid tag
+    if interleaved_samples is None:
+        interleaved_samples = _build_interleaved_samples(all_samples)
+    interleaved_negatives = [sample for tid, sample in interleaved_samples
+                             if tid != tid_positive]
 
     # Validate inputs
     if not positive_samples:
         logger.error(f"No positive samples found for topic ID {tid_positive}.")
         raise ValueError(f"No positive samples found for topic ID {tid_positive}.")
-    if not negative_lists:
+    if not interleaved_negatives:
          logger.error(f"No non-empty negative sample lists found for topic ID {tid_positive}.")
          raise ValueError(f"No non-empty negative sample lists found for topic ID {tid_positive}.")
     if num_samples < 0:
         logger.warning(f"num_samples ({num_samples}) is negative. Returning empty list.")
         return []
 
-    interleaved_negatives = []
-    # Find the maximum length among negative lists
-    max_len =  max(len(neg_list) for neg_list in negative_lists)
-
-    # Build the interleaved list
-    for i in range(max_len):
-        for neg_list in negative_lists:
-            if i < len(neg_list):  # Check if the list has an element at this index
-                interleaved_negatives.append(neg_list[i])
-
-    # --- 2. Generate all possible unique combinations ---
-    all_pairs = []
-    for pos_sample in positive_samples:
-        for neg_sample in interleaved_negatives:
-            all_pairs.append((pos_sample, neg_sample))
-
-    total_possible_pairs = len(all_pairs)    # --- 3. Handle num_samples: Subsample or return all ---
+    # --- 2. Handle num_samples: Subsample or return all ---
+    # Sample pair indices directly instead of materializing the full Cartesian
+    # product: for P positives and M negatives that product holds P*M tuples,
+    # while index k maps to the pair (positives[k // M], negatives[k % M])
+    num_negatives = len(interleaved_negatives)
+    total_possible_pairs = len(positive_samples) * num_negatives
     if num_samples <= total_possible_pairs:
-        return random.sample(all_pairs, num_samples)
+        # numpy draws the distinct indices in vectorized C code, which is far
+        # faster than random.sample for large index spaces
+        sampled_indices = _rng.choice(total_possible_pairs, size=num_samples,
+                                      replace=False, shuffle=False)
+        return [(positive_samples[k // num_negatives], interleaved_negatives[k % num_negatives])
+                for k in sampled_indices]
     else:
         logger.warning(f"Requested num_samples ({num_samples}) is greater than total possible pairs ({total_possible_pairs}). "
                        f"Returning all {total_possible_pairs} unique pairs.")
-        return all_pairs
+        # itertools.product builds the full Cartesian product in C, avoiding a
+        # Python-level nested loop over total_possible_pairs iterations
+        return list(product(positive_samples, interleaved_negatives))
 
 def main() -> None:
     config = ExperimentConfig()
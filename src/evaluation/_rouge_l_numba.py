@@ -0,0 +1,64 @@
+'''
+_rouge_l_numba.py
+
+JIT-compiled longest-common-subsequence kernel for ROUGE-L.
+
+The LCS length is an O(m*n) dynamic program that dominates ROUGE-L cost for
+long summaries when run through the interpreter. The kernel below operates on
+int32 token-ID arrays with a rolling two-row buffer and is compiled with numba
+when available; without numba it falls back to the same code as a plain Python
+function, which keeps the module importable in minimal environments.
+'''
+
+# Standard library imports
+import logging
+
+# Third-party imports
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when numba is not installed."""
+        def decorator(func):
+            return func
+        return decorator
+
+# Set up logging
+logger = logging.getLogger(__name__)
+
+if not NUMBA_AVAILABLE:
+    logger.warning("numba is not installed; the ROUGE-L LCS kernel runs uncompiled.")
+
+@njit(cache=True)
+def lcs_len(a: np.ndarray, b: np.ndarray) -> int:
+    """
+    Computes the longest-common-subsequence length of two int32 ID sequences.
+
+    Uses the classic two-row formulation: only the previous and current DP
+    rows are kept and swapped each outer iteration, so memory stays O(len(b)).
+
+    Args:
+        a: First token-ID sequence (np.int32 array).
+        b: Second token-ID sequence (np.int32 array).
+
+    Returns:
+        The LCS length as an integer.
+    """
+    prev_row = np.zeros(len(b) + 1, dtype=np.int32)
+    curr_row = np.zeros(len(b) + 1, dtype=np.int32)
+    for i in range(len(a)):
+        a_i = a[i]
+        for j in range(len(b)):
+            if a_i == b[j]:
+                curr_row[j + 1] = prev_row[j] + 1
+            elif prev_row[j + 1] >= curr_row[j]:
+                curr_row[j + 1] = prev_row[j + 1]
+            else:
+                curr_row[j + 1] = curr_row[j]
+        prev_row, curr_row = curr_row, prev_row
+    return int(prev_row[len(b)])
@@ -8,14 +8,16 @@ reference text using metrics like ROUGE and BERTScore, loading models only once.
 # Standard library imports
 import sys
 import logging
-from typing import Dict
+from typing import Dict, List
 
 # --- Third-party imports ---
-from rouge_score import rouge_scorer
+import numpy as np
+from rouge_score import rouge_scorer, tokenizers
 from bert_score import BERTScorer
 
 # --- Local imports ---
 from src.utils import get_device
+from src.evaluation._rouge_l_numba import lcs_len
 from config.score_and_plot_config import ScoreAndPlotConfig
 
 # Set up logging
@@ -54,17 +56,25 @@ class ExtrinsicQualityScorer:
 
         self.device = get_device()
         # 1. Initialize ROUGE Scorer (Stemmer hardcoded to True)
+        # ROUGE-L is computed with the compiled LCS kernel instead of rouge_score,
+        # so only the n-gram variants are requested here. The tokenizer matches
+        # the one RougeScorer uses internally, keeping tokenization identical.
         logger.info("Initializing ROUGE scorer (use_stemmer=True)...")
         try:
             self.rouge_scorer = rouge_scorer.RougeScorer(
-                ['rouge1', 'rouge2', 'rougeL'],
-                use_stemmer=True 
+                ['rouge1', 'rouge2'],
+                use_stemmer=True
             )
+            self.rouge_tokenizer = tokenizers.DefaultTokenizer(use_stemmer=True)
             logger.info("ROUGE scorer initialized successfully.")
         except Exception as e:
             logger.error(f"Failed to initialize ROUGE scorer: {e}", exc_info=True)
             raise
 
+        # Warm up the LCS kernel with a dummy call so the one-off JIT compile
+        # happens here rather than being billed to the first scored article.
+        lcs_len(np.zeros(1, dtype=np.int32), np.zeros(1, dtype=np.int32))
+
         # 2. Initialize BERTScorer (Model name from config)
         bert_model = self.config.bertscore_model_name
         logger.info(f"Initializing BERTScorer (model: {bert_model}, device: {self.device})...")
@@ -82,6 +92,33 @@ class ExtrinsicQualityScorer:
 
         logger.info("TextSimilarityEvaluator initialized successfully.")
 
+    def _rouge_l_fmeasure(self, reference_tokens: List[str], candidate_tokens: List[str]) -> float:
+        """
+        Calculates the ROUGE-L F1 score from pre-tokenized (stemmed) token lists.
+
+        Tokens are mapped to int32 IDs through a shared vocabulary so the LCS
+        length can be computed by the compiled two-row kernel in _rouge_l_numba.
+
+        Args:
+            reference_tokens (List[str]): Tokens of the reference text.
+            candidate_tokens (List[str]): Tokens of the generated text.
+
+        Returns:
+            float: The ROUGE-L F1 score, or 0.0 if either token list is empty.
+        """
+        if not reference_tokens or not candidate_tokens:
+            return 0.0
+        vocab: Dict[str, int] = {}
+        reference_ids = np.fromiter((vocab.setdefault(token, len(vocab)) for token in reference_tokens),
+                                    dtype=np.int32, count=len(reference_tokens))
+        candidate_ids = np.fromiter((vocab.setdefault(token, len(vocab)) for token in candidate_tokens),
+                                    dtype=np.int32, count=len(candidate_tokens))
+        lcs = lcs_len(reference_ids, candidate_ids)
+        if lcs == 0:
+            return 0.0
+        precision = lcs / len(candidate_tokens)
+        recall = lcs / len(reference_tokens)
+        return 2 * precision * recall / (precision + recall)
 
     def get_similarity_scores(self, generated_text: str, reference_text: str) -> Dict[str, float]:
         """
@@ -115,7 +152,10 @@ class ExtrinsicQualityScorer:
             rouge_results = self.rouge_scorer.score(target=reference_text, prediction=generated_text)
             scores['rouge1'] = rouge_results['rouge1'].fmeasure
             scores['rouge2'] = rouge_results['rouge2'].fmeasure
-            scores['rougeL'] = rouge_results['rougeL'].fmeasure
+            scores['rougeL'] = self._rouge_l_fmeasure(
+                reference_tokens=self.rouge_tokenizer.tokenize(reference_text),
+                candidate_tokens=self.rouge_tokenizer.tokenize(generated_text)
+            )
         except Exception as e:
             logger.error(f"Failed to calculate ROUGE scores for text pair. Error: {e}", exc_info=False)
             # Keep default 0.0 scores
@@ -130,6 +170,65 @@ class ExtrinsicQualityScorer:
 
         return scores
 
+    def get_similarity_scores_batch(self, generated_texts: List[str],
+                                    reference_text: str) -> List[Dict[str, float]]:
+        """
+        Calculates similarity scores for several generated texts against one
+        shared reference text.
+
+        ROUGE is computed per pair (cheap, CPU-bound), while BERTScore runs as
+        a single padded forward pass over all candidates, amortizing the
+        per-call tokenization and kernel-launch overhead across the batch.
+
+        Args:
+            generated_texts (List[str]): The texts generated by a model or process.
+            reference_text (str): The ground truth or target text shared by all candidates.
+
+        Returns:
+            List[Dict[str, float]]: One score dictionary per generated text, in
+                                    input order, with the same keys as
+                                    get_similarity_scores. Scores are 0.0 where
+                                    calculation fails or inputs are empty.
+        """
+        all_scores = [{'rouge1': 0.0, 'rouge2': 0.0, 'rougeL': 0.0, 'bert_f1': 0.0}
+                      for _ in generated_texts]
+
+        if not reference_text:
+            logger.warning("Received empty reference text. Returning zero scores for the batch.")
+            return all_scores
+
+        # 1. Calculate ROUGE Scores per candidate (reference tokenized once)
+        reference_tokens = self.rouge_tokenizer.tokenize(reference_text)
+        for scores, generated_text in zip(all_scores, generated_texts):
+            if not generated_text:
+                continue
+            try:
+                rouge_results = self.rouge_scorer.score(target=reference_text, prediction=generated_text)
+                scores['rouge1'] = rouge_results['rouge1'].fmeasure
+                scores['rouge2'] = rouge_results['rouge2'].fmeasure
+                scores['rougeL'] = self._rouge_l_fmeasure(
+                    reference_tokens=reference_tokens,
+                    candidate_tokens=self.rouge_tokenizer.tokenize(generated_text)
+                )
+            except Exception as e:
+                logger.error(f"Failed to calculate ROUGE scores for text pair. Error: {e}", exc_info=False)
+                # Keep default 0.0 scores
+
+        # 2. Calculate BERTScore for all non-empty candidates in one batch
+        candidate_indices = [text_num for text_num, text in enumerate(generated_texts) if text]
+        if candidate_indices:
+            try:
+                candidates = [generated_texts[text_num] for text_num in candidate_indices]
+                _, _, f1 = self.bert_scorer.score(cands=candidates,
+                                                  refs=[reference_text] * len(candidates))
+                for text_num, f1_value in zip(candidate_indices, f1.tolist()):
+                    all_scores[text_num]['bert_f1'] = f1_value
+            except Exception as e:
+                logger.error(f"Failed to calculate batched BERT scores. Error: {e}", exc_info=False)
+                # Keep default 0.0 scores
+
+        return all_scores
+
 # --- Main Execution Example with Test Cases ---
 
 def main():
@@ -11,9 +11,9 @@ import re
 from typing import Dict, Optional
 
 # --- Third-party imports ---
+import numpy as np
 import torch
 import nltk
-from nltk.util import ngrams
 
 # --- Local imports ---
 from src.utils import load_model_and_tokenizer
@@ -167,6 +167,29 @@ class IntrinsicQualityScorer:
             logger.error(f"Error calculating perplexity: {e}", exc_info=True)
             return float('inf')
 
+    # Multiplier for the rolling polynomial n-gram hash. Wrapping int64
+    # arithmetic is intentional; collisions are vanishingly unlikely at
+    # summary lengths and only distinct counts are needed
+    _NGRAM_HASH_PRIME = np.int64(1000003)
+
+    @classmethod
+    def _distinct_ngram_ratio(cls, ids: np.ndarray, n: int) -> float:
+        """
+        Computes the distinct-n ratio over an int32 ID sequence.
+
+        Instead of materializing Python tuples per n-gram and set-hashing them
+        (O(n) Python-level work per position), every n-gram is folded into one
+        int64 via a rolling polynomial hash computed with shifted array slices,
+        and np.unique counts the distinct values — all in vectorized NumPy.
+        """
+        num_ngrams = len(ids) - n + 1
+        if num_ngrams <= 0:
+            return 0.0
+        hashes = np.zeros(num_ngrams, dtype=np.int64)
+        for k in range(n):
+            hashes = hashes * cls._NGRAM_HASH_PRIME + ids[k:num_ngrams + k]
+        return len(np.unique(hashes)) / num_ngrams
+
     def _calculate_distinct_word_n(self, text: str, n: int) -> float:
         """
         Internal helper to calculate Distinct-Word-N using nltk.word_tokenize.
@@ -177,12 +200,11 @@ class IntrinsicQualityScorer:
         tokens = nltk.word_tokenize(text.lower())
         if len(tokens) < n:
             return 0.0
-        n_grams_list = list(ngrams(tokens, n))
-        if not n_grams_list:
-             return 0.0
-        distinct_n_grams_count = len(set(n_grams_list))
-        total_n_grams_count = len(n_grams_list)
-        return distinct_n_grams_count / total_n_grams_count
+        # Map tokens to dense int IDs and count distinct n-grams vectorized
+        vocab: Dict[str, int] = {}
+        token_ids = np.fromiter((vocab.setdefault(token, len(vocab)) for token in tokens),
+                                dtype=np.int32, count=len(tokens))
+        return self._distinct_ngram_ratio(token_ids, n)
 
     def _calculate_distinct_char_n(self, text: str, n: int) -> float:
         """
@@ -194,12 +216,10 @@ class IntrinsicQualityScorer:
         processed_text = text.lower()
         if len(processed_text) < n:
             return 0.0
-        char_n_grams_list = list(ngrams(processed_text, n))
-        if not char_n_grams_list:
-            return 0.0
-        distinct_n_grams_count = len(set(char_n_grams_list))
-        total_n_grams_count = len(char_n_grams_list)
-        return distinct_n_grams_count / total_n_grams_count
+        # UTF-32 little-endian encodes each character as one int32 code point,
+        # turning the string into an ID array without a Python-level loop
+        char_ids = np.frombuffer(processed_text.encode('utf-32-le'), dtype=np.int32)
+        return self._distinct_ngram_ratio(char_ids, n)
 
     def get_intrinsic_scores(self, generated_text: str, n_value: Optional[int] = None) -> Dict[str, float]:
         """
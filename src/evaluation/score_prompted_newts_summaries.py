@@ -8,13 +8,60 @@ This script scores the NEWTS summaries generated by the prompted model.
 import os
 import json
 import logging
-from typing import Dict, Any, Optional # Added Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Third-party imports
+import ijson
 
 from src.evaluation.scorer import Scorer
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# One Scorer per worker process, created by the pool initializer so the
+# model loading cost is paid once per worker instead of once per task
+_WORKER_SCORER: Optional[Scorer] = None
+
+def _init_worker() -> None:
+    """Initializes the module-level Scorer inside a worker process."""
+    global _WORKER_SCORER
+    _WORKER_SCORER = Scorer()
+
+def _score_article(task: Tuple[str, List[str], List[str], Optional[int], Optional[int],
+                               Optional[str], Optional[str]]
+                   ) -> Tuple[str, Dict[str, Optional[Dict[str, Any]]]]:
+    """
+    Scores all summary variations of one article inside a worker process.
+
+    The variations share the article's tid1/tid2/references, so they go through
+    Scorer.score_individual_texts which batches the transformer-based scoring
+    across the whole variation set instead of one call per text.
+
+    Args:
+        task: Tuple of (article_idx_str, variation_keys, generated_texts,
+              tid1, tid2, reference_text1, reference_text2).
+
+    Returns:
+        Tuple of (article_idx_str, {variation_key: score_dict}), where a
+        score_dict is None if scoring that variation failed.
+    """
+    article_idx_str, variation_keys, generated_texts, tid1, tid2, ref1, ref2 = task
+    try:
+        score_dicts = _WORKER_SCORER.score_individual_texts(
+            texts=generated_texts,
+            tid1=tid1,
+            tid2=tid2,
+            reference_text1=ref1,
+            reference_text2=ref2
+        )
+        return article_idx_str, dict(zip(variation_keys, score_dicts))
+    except Exception as e:
+        logger.error(f"Error scoring Article {article_idx_str}: {e}", exc_info=False)
+        return article_idx_str, {variation_key: None for variation_key in variation_keys}
+
 def score_newts_summaries(input_file_path: str) -> Optional[Dict[str, Any]]:
     """
     Loads generated summaries from a JSON file, scores each unique summary 
@@ -62,134 +109,137 @@ def score_newts_summaries(input_file_path: str) -> Optional[Dict[str, Any]]:
 
     logger.info(f"Starting scoring process for file: {input_file_path}")
 
-    # --- 1. Initialize Scorer ---
+    # --- 1. Read Experiment Information ---
+    # The input file can run to hundreds of MB, so it is never json.load-ed
+    # whole: ijson pulls out 'experiment_information' here, and the articles
+    # are streamed one at a time below.
+    # use_float=True: ijson otherwise parses JSON floats as decimal.Decimal,
+    # which json.dumps rejects when the scored output is written at the end
     try:
-        # Ensure Scorer is accessible. If it's in a different relative path, adjust.
-        # from ..evaluation.scorer import Scorer # Example if it's one level up then in evaluation
-        scorer = Scorer() 
-        logger.info("Scorer initialized successfully.")
-    except ImportError:
-        logger.error("Failed to import Scorer. Please ensure 'src.evaluation.scorer' is correct and in PYTHONPATH.")
-        return None
-    except Exception as e:
-        logger.error(f"Fatal Error: Failed to initialize the Scorer: {e}", exc_info=True)
-        return None
-
-    # --- 2. Load Input Data ---
-    try:
-        with open(input_file_path, 'r', encoding='utf-8') as f:
-            input_data = json.load(f)
-        logger.info(f"Successfully loaded data from {input_file_path}")
-
-        if 'experiment_information' not in input_data or 'generated_summaries' not in input_data:
-            logger.error("Input JSON is missing required keys: 'experiment_information' or 'generated_summaries'")
+        with open(input_file_path, 'rb') as f:
+            experiment_information = next(ijson.items(f, 'experiment_information', use_float=True), None)
+        if experiment_information is None:
+            logger.error("Input JSON is missing required key: 'experiment_information'")
             return None
-        if not isinstance(input_data['generated_summaries'], dict):
-            logger.error("'generated_summaries' should be a dictionary. Found type: %s", type(input_data['generated_summaries']))
-            return None
-            
     except FileNotFoundError:
         logger.error(f"Input file not found: {input_file_path}")
         return None
-    except json.JSONDecodeError as e:
+    except ijson.JSONError as e:
         logger.error(f"Error decoding JSON from file: {input_file_path} - {e}")
         return None
     except Exception as e:
         logger.error(f"An unexpected error occurred while reading the input file: {e}", exc_info=True)
         return None
 
-    # --- 3. Prepare Output Structure ---
+    # --- 2. Prepare Output Structure ---
     output_data = {
-        'experiment_information': input_data['experiment_information'],
-        'generated_summaries': input_data['generated_summaries'], # Keep original generated summaries
+        'experiment_information': experiment_information,
+        'generated_summaries': {}, # Filled while streaming the input below
         'scored_summaries': {}  # This will hold the new flattened structure
     }
 
-    # --- 4. Iterate and Score ---
-    total_articles = len(input_data['generated_summaries'])
-    processed_articles_count = 0
-    logger.info(f"Starting to score summaries for {total_articles} articles.")
-
-    for article_idx_str, article_content in input_data['generated_summaries'].items():
-        processed_articles_count += 1
-        logger.info(f"Processing article {processed_articles_count}/{total_articles} (ID: {article_idx_str})")
-        
-        # This will store scores directly keyed by the unique prompt strategy variation_key
-        flat_article_scores: Dict[str, Optional[Dict[str, Any]]] = {} 
-        processed_neutral_for_this_article = False # To score "neutral" only once per article
-
-        # Extract article-level metadata needed for scoring all its summaries
-        tid1 = article_content.get('tid1')
-        tid2 = article_content.get('tid2')
-        ref1 = article_content.get('original_summary1')
-        ref2 = article_content.get('original_summary2')
-        
-        summaries_by_behavior = article_content.get('summaries', {})
-
-        if not isinstance(summaries_by_behavior, dict):
-            logger.warning(f"Article {article_idx_str}: 'summaries' field is not a dictionary. Skipping scoring for this article.")
-            output_data['scored_summaries'][article_idx_str] = {} # Assign empty dict for this article
-            continue
-
-        # Iterate through all summaries to flatten them by their unique variation_key
-        for behavior_name, variations_dict in summaries_by_behavior.items():
-            if not isinstance(variations_dict, dict):
-                logger.warning(f"Article {article_idx_str}, Behavior {behavior_name}: Value is not a dictionary of variations. Skipping this behavior group.")
-                continue
-
-            for variation_key, prompt_and_summary_dict in variations_dict.items():
-                # variation_key examples: "neutral", "topic_tid1_encouraged", "sentiment_positive_encouraged"
-                
-                # Handle "neutral" summaries: score only the first valid encounter per article
-                if variation_key == "neutral":
-                    if processed_neutral_for_this_article:
-                        logger.debug(f"Article {article_idx_str}: 'neutral' summary already processed and scored. Skipping redundant entry under behavior '{behavior_name}'.")
-                        continue 
-                    # If not processed, it will be handled like any other key below.
-                    # We'll mark it as processed *after* successful scoring.
-                
-                # If this specific variation_key (e.g. "topic_tid1_encouraged") has already been placed in flat_article_scores, skip.
-                # This handles cases where a non-"neutral" key might somehow appear under multiple behavior groups.
-                if variation_key != "neutral" and variation_key in flat_article_scores:
-                    logger.warning(f"Article {article_idx_str}: Variation key '{variation_key}' encountered again under behavior '{behavior_name}'. Already processed. Check input data generation.")
-                    continue
+    # --- 3. Stream Articles Into Scoring Tasks ---
+    # Validate each streamed article and flatten its summaries by their unique
+    # variation_key; the generator feeds the process pool directly so parsing,
+    # task preparation and scoring are pipelined.
+    def _iter_tasks() -> Iterator[Tuple[str, List[str], List[str], Optional[int], Optional[int],
+                                        Optional[str], Optional[str]]]:
+        with open(input_file_path, 'rb') as f:
+            for article_idx_str, article_content in ijson.kvitems(f, 'generated_summaries', use_float=True):
+                output_data['generated_summaries'][article_idx_str] = article_content # Keep original generated summaries
 
-                if not isinstance(prompt_and_summary_dict, dict):
-                    logger.warning(f"Article {article_idx_str}, Behavior {behavior_name}, Variation {variation_key}: Value is not a dictionary. Skipping.")
-                    if variation_key not in flat_article_scores: # Avoid overwriting a successfully scored neutral
-                         flat_article_scores[variation_key] = None 
-                    continue
+                # This will store scores directly keyed by the unique prompt strategy variation_key
+                flat_article_scores: Dict[str, Optional[Dict[str, Any]]] = {}
+                article_variation_keys: List[str] = []
+                article_texts: List[str] = []
+                queued_neutral_for_this_article = False # To score "neutral" only once per article
 
-                generated_text = prompt_and_summary_dict.get('summary')
+                # Extract article-level metadata needed for scoring all its summaries
+                tid1 = article_content.get('tid1')
+                tid2 = article_content.get('tid2')
+                ref1 = article_content.get('original_summary1')
+                ref2 = article_content.get('original_summary2')
 
-                if not isinstance(generated_text, str):
-                    logger.warning(f"Article {article_idx_str}, Behavior {behavior_name}, Variation {variation_key}: Generated text is not a string ('{type(generated_text)}'). Skipping.")
-                    if variation_key not in flat_article_scores:
-                        flat_article_scores[variation_key] = None
+                summaries_by_behavior = article_content.get('summaries', {})
+
+                if not isinstance(summaries_by_behavior, dict):
+                    logger.warning(f"Article {article_idx_str}: 'summaries' field is not a dictionary. Skipping scoring for this article.")
+                    output_data['scored_summaries'][article_idx_str] = {} # Assign empty dict for this article
                     continue
-                 
-                # Score the summary text
-                try:
-                    logger.debug(f"Scoring for Article {article_idx_str}, Strategy Key '{variation_key}' (found under Behavior '{behavior_name}')")
-                    score_dict = scorer.score_individual_text(
-                        text=generated_text,
-                        tid1=tid1,
-                        tid2=tid2,
-                        reference_text1=ref1,
-                        reference_text2=ref2
-                        # Assuming Scorer's default arguments for topic_method, distinct_n are fine
-                    )
-                    flat_article_scores[variation_key] = score_dict
-                    if variation_key == "neutral": # Mark neutral as processed only after successful scoring
-                        processed_neutral_for_this_article = True
-
-
-                except Exception as e:
-                    logger.error(f"Error scoring Article {article_idx_str}, Strategy Key '{variation_key}': {e}", exc_info=False) # Set exc_info=True for more details if needed
-                    if variation_key not in flat_article_scores: # Avoid overwriting successfully scored neutral
-                        flat_article_scores[variation_key] = None 
-            
-        output_data['scored_summaries'][article_idx_str] = flat_article_scores
+
+                # Iterate through all summaries to flatten them by their unique variation_key
+                for behavior_name, variations_dict in summaries_by_behavior.items():
+                    if not isinstance(variations_dict, dict):
+                        logger.warning(f"Article {article_idx_str}, Behavior {behavior_name}: Value is not a dictionary of variations. Skipping this behavior group.")
+                        continue
+
+                    for variation_key, prompt_and_summary_dict in variations_dict.items():
+                        # variation_key examples: "neutral", "topic_tid1_encouraged", "sentiment_positive_encouraged"
+
+                        # Handle "neutral" summaries: queue only the first valid encounter per article
+                        if variation_key == "neutral" and queued_neutral_for_this_article:
+                            logger.debug(f"Article {article_idx_str}: 'neutral' summary already queued for scoring. Skipping redundant entry under behavior '{behavior_name}'.")
+                            continue
+
+                        # If this specific variation_key (e.g. "topic_tid1_encouraged") has already been queued, skip.
+                        # This handles cases where a non-"neutral" key might somehow appear under multiple behavior groups.
+                        if variation_key != "neutral" and variation_key in flat_article_scores:
+                            logger.warning(f"Article {article_idx_str}: Variation key '{variation_key}' encountered again under behavior '{behavior_name}'. Already processed. Check input data generation.")
+                            continue
+
+                        if not isinstance(prompt_and_summary_dict, dict):
+                            logger.warning(f"Article {article_idx_str}, Behavior {behavior_name}, Variation {variation_key}: Value is not a dictionary. Skipping.")
+                            if variation_key not in flat_article_scores: # Avoid overwriting a queued neutral
+                                 flat_article_scores[variation_key] = None
+                            continue
+
+                        generated_text = prompt_and_summary_dict.get('summary')
+
+                        if not isinstance(generated_text, str):
+                            logger.warning(f"Article {article_idx_str}, Behavior {behavior_name}, Variation {variation_key}: Generated text is not a string ('{type(generated_text)}'). Skipping.")
+                            if variation_key not in flat_article_scores:
+                                flat_article_scores[variation_key] = None
+                            continue
+
+                        flat_article_scores[variation_key] = None # Placeholder until the pool result arrives
+                        article_variation_keys.append(variation_key)
+                        article_texts.append(generated_text)
+                        if variation_key == "neutral":
+                            queued_neutral_for_this_article = True
+
+                output_data['scored_summaries'][article_idx_str] = flat_article_scores
+                if article_texts:
+                    # One task per article so the worker can batch-score all variations
+                    yield (article_idx_str, article_variation_keys, article_texts,
+                           tid1, tid2, ref1, ref2)
+
+    # --- 4. Score in Parallel ---
+    # Scoring is CPU-bound and independent per summary, so dispatch the tasks
+    # to worker processes; each worker loads its own Scorer once via _init_worker.
+    # Futures are submitted by hand with a bounded in-flight window:
+    # executor.map would exhaust the task generator (and with it the whole
+    # input file) before yielding its first result, buffering every task's
+    # generated texts in the executor at once
+    max_workers = os.cpu_count()
+    window_size = 2 * max_workers
+    logger.info(f"Streaming articles into {max_workers} worker processes.")
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+            tasks = _iter_tasks()
+            in_flight = deque(executor.submit(_score_article, task)
+                              for task in islice(tasks, window_size))
+            while in_flight:
+                article_idx_str, article_scores = in_flight.popleft().result()
+                next_task = next(tasks, None)
+                if next_task is not None:
+                    in_flight.append(executor.submit(_score_article, next_task))
+                output_data['scored_summaries'][article_idx_str].update(article_scores)
+    except ijson.JSONError as e:
+        logger.error(f"Error decoding JSON from file: {input_file_path} - {e}")
+        return None
+    except Exception as e:
+        logger.error(f"Fatal Error: Scoring pool failed: {e}", exc_info=True)
+        return None
 
     logger.info(f"Finished scoring all articles. Results generated for {len(output_data['scored_summaries'])} articles.")
     return output_data
@@ -206,10 +256,12 @@ def main() -> None:
 
     scored_summaries = score_newts_summaries(input_json_path)
 
-    # Save the scored summaries to a new JSON file
+    # Save the scored summaries to a new JSON file. Serializing to one string
+    # and writing it in a single call avoids json.dump's many small iterencode
+    # writes, which is several times slower on large payloads
     output_json_path = os.path.join(scores_path, file_path)
     with open(output_json_path, 'w', encoding='utf-8') as f:
-        json.dump(scored_summaries, f, ensure_ascii=False, indent=2)
+        f.write(json.dumps(scored_summaries, ensure_ascii=False, indent=2))
 
     logger.info(f"Successfully saved scored summaries to {output_json_path}")
 if __name__ == '__main__':
@@ -7,125 +7,459 @@ This script scores the steered NEWTS summaries generated by the steered NEWTS mo
 
 # Standard library imports
 import os
-import json
+import sys
+import hashlib
+import functools
 import logging
-from typing import Dict, Any, Optional # Added Optional
+import queue
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# Third-party imports
+import ijson
+import msgspec
+import orjson
 
 from src.evaluation.scorer import Scorer
+from src.evaluation.topic_scorer import TopicScorer
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def score_newts_summaries(input_file_path: str) -> Optional[Dict[str, Any]]:
+# One Scorer per worker process, created by the pool initializer so the
+# model loading cost is paid once per worker instead of once per job
+_WORKER_SCORER: Optional[Scorer] = None
+
+# Flush buffered resume-cache lines to disk every this many completed jobs
+_CACHE_FLUSH_INTERVAL = 10
+
+# Log scoring progress every this many completed articles; per-article info
+# logging would format and emit a record on every iteration of the hot loop
+_PROGRESS_LOG_INTERVAL = 10
+
+class ArticleData(msgspec.Struct):
+    """
+    Schema for one article's entry under 'generated_summaries'.
+
+    Each streamed article is validated against this in a single
+    msgspec.convert pass (lax mode, so numeric tids coerce to int), replacing
+    the ad-hoc isinstance/get checks that previously ran field by field in
+    the hot parse loop. A malformed entry fails with one ValidationError
+    naming the offending field. The summaries values stay Any on purpose:
+    they are checked per strength in the parse loop so one malformed summary
+    only loses that strength, not the whole article.
+    """
+    tid1: Optional[int] = None
+    tid2: Optional[int] = None
+    summary1: Optional[str] = None
+    summary2: Optional[str] = None
+    summaries: Dict[str, Any] = {}
+
+@functools.lru_cache(maxsize=1)
+def _get_scorer() -> Scorer:
+    """
+    Returns a process-wide Scorer singleton.
+
+    Scorer construction loads the sentiment/topic/perplexity/BERTScore models
+    and dominates startup, so callers scoring several input files in one
+    process (or the pool workers below) share one instance. Callers that need
+    a fresh Scorer must call _get_scorer.cache_clear() first.
+    """
+    return Scorer()
+
+def _init_worker() -> None:
+    """Initializes the module-level Scorer inside a worker process."""
+    global _WORKER_SCORER
+    _WORKER_SCORER = _get_scorer()
+
+def _empty_text_scores(text: str,
+                       tid1: Optional[int], tid2: Optional[int],
+                       ref1: Optional[str], ref2: Optional[str],
+                       distinct_n: int = 2) -> Dict[str, Any]:
+    """
+    Builds a zero-filled score dict for an empty/degenerate generated text,
+    shaped like score_individual_text output so downstream consumers need no
+    branching. Scoring a zero-token string would still pay the full ROUGE,
+    BERTScore, topic and perplexity machinery for all-default results.
+    """
+    scores: Dict[str, Any] = {"text": text, "empty": True}
+    if tid1 is not None:
+        scores["tid1_used"] = tid1
+    if tid2 is not None:
+        scores["tid2_used"] = tid2
+    if ref1 is not None:
+        scores["reference_text1_used"] = ref1
+    if ref2 is not None:
+        scores["reference_text2_used"] = ref2
+    scores["distinct_n_used"] = distinct_n
+
+    scores['sentiment_scores'] = {}
+    scores['intrinsic_scores'] = {
+        'perplexity': float('inf'),
+        f'distinct_word_{distinct_n}': 0.0,
+        f'distinct_char_{distinct_n}': 0.0,
+    }
+    if tid1 is not None:
+        zero_topic_scores = {method: 0.0 for method in TopicScorer.VALID_METHODS}
+        scores['topic_scores'] = {'tid1': dict(zero_topic_scores)}
+        if tid2 is not None:
+            scores['topic_scores']['tid2'] = dict(zero_topic_scores)
+    if ref1 is not None:
+        scores['extrinsic_scores'] = {}
+    scores['readability_scores'] = {}
+    scores['toxicity_scores'] = {}
+    return scores
+
+def _resume_cache_key(article_idx_str: str, strength_str: str, generated_text: str,
+                      tid1: Optional[int], tid2: Optional[int]) -> str:
+    """
+    Builds the resume-cache key for one summary. The content hash means a
+    regenerated summary with different text is rescored rather than served
+    a stale cached score.
+    """
+    text_hash = hashlib.blake2b(generated_text.encode('utf-8'), digest_size=16).hexdigest()
+    return f"{article_idx_str}|{strength_str}|{text_hash}|{tid1}|{tid2}"
+
+def _score_article(job: Tuple[str, List[str], List[str], Optional[int], Optional[int],
+                              Optional[str], Optional[str]]
+                   ) -> Tuple[str, Dict[str, Optional[Dict[str, Any]]]]:
     """
-    Loads generated summaries from a JSON file, scores each summary using the Scorer,
-    and returns a dictionary containing the original data plus the scores.
+    Scores all steering strengths of one article inside a worker process.
 
-    Assumes the input JSON file has 'experiment_information' and 
-    'generated_summaries' keys. 'generated_summaries' is expected to be a 
+    The strengths share the article's tid1/tid2/references, so the article
+    context — validated references plus topic artifacts — is built once, and
+    Scorer.score_individual_texts batches the transformer-based extrinsic
+    scoring across the whole strength set instead of one call per text.
+
+    Args:
+        job: Tuple of (article_idx_str, strength_strs, generated_texts,
+             tid1, tid2, reference_text1, reference_text2).
+
+    Returns:
+        Tuple of (article_idx_str, {strength_str: score_dict}), where a
+        score_dict is None if scoring that strength failed.
+    """
+    article_idx_str, strength_strs, generated_texts, tid1, tid2, ref1, ref2 = job
+    try:
+        context = _WORKER_SCORER.prepare_article_context(
+            tid1=tid1, tid2=tid2,
+            reference_text1=ref1, reference_text2=ref2)
+        # Rely on default arguments within score_individual_texts for
+        # topic_method and distinct_n
+        score_dicts = _WORKER_SCORER.score_individual_texts(
+            texts=generated_texts,
+            tid1=context['tid1'],
+            tid2=context['tid2'],
+            reference_text1=context['reference_text1'],
+            reference_text2=context['reference_text2'],
+            topic_resources=context['topic_resources']
+        )
+        return article_idx_str, dict(zip(strength_strs, score_dicts))
+    except Exception as e:
+        logger.error(f"Error scoring article {article_idx_str}: {e}", exc_info=False)
+        return article_idx_str, {strength_str: None for strength_str in strength_strs}
+
+def score_newts_summaries(input_file_path: str,
+                          cache_file_path: Optional[str] = None,
+                          include_inputs: bool = False
+                          ) -> Optional[Tuple[Dict[str, Any],
+                                              Iterator[Tuple[str, Optional[Dict[str, Any]]]]]]:
+    """
+    Streams generated summaries from a JSON file and scores each summary using
+    the Scorer, yielding results article by article.
+
+    Assumes the input JSON file has 'experiment_information' and
+    'generated_summaries' keys. 'generated_summaries' is expected to be a
     dictionary keyed by stringified article_idx.
 
+    The caller consumes the returned iterator and writes each article's scores
+    as they arrive, so neither the full input nor the full scored output is
+    ever held in memory at once.
+
     Args:
         input_file_path (str): The path to the input JSON file.
+        cache_file_path (Optional[str]): Path to a resume-cache NDJSON sidecar
+                         file. Scores found in the cache are reused instead of
+                         being recomputed, and freshly computed scores are
+                         appended to it, so a crashed or repeated run only
+                         pays for summaries it has not scored before. Defaults
+                         to None (no caching).
+        include_inputs (bool): If True, each yielded article carries its input
+                         fields (tids, reference summaries, generated texts)
+                         alongside the scores, roughly doubling the output
+                         size. If False (default), the output holds scores
+                         only — the text/reference copies embedded in each
+                         per-strength score dict are stripped as well — and
+                         the input file recorded as 'source_file' in
+                         experiment_information is the join key back to the
+                         inputs.
 
     Returns:
-        Optional[Dict[str, Any]]: A dictionary containing the original data and 
-                                 a new 'scored_summaries' key with the scoring results.
-                                 Returns None if the input file cannot be read or parsed,
-                                 or if the Scorer fails to initialize.
+        Optional[Tuple]: A pair of (experiment_information, iterator), where the
+                         iterator yields (article_idx_str, article_scores) pairs
+                         in input order; article_scores is None for unscorable
+                         articles. Returns None if the input file cannot be read
+                         or parsed.
     """
     logger.info(f"Starting scoring process for file: {input_file_path}")
 
-    # --- 1. Initialize Scorer ---
-    try:
-        scorer = Scorer() 
-        logger.info("Scorer initialized successfully.")
-    except Exception as e:
-        logger.error(f"Fatal Error: Failed to initialize the Scorer: {e}", exc_info=True)
-        return None
-
-    # --- 2. Load Input Data ---
+    # --- 1. Read Experiment Information ---
+    # The input file can run to hundreds of MB, so it is never loaded whole:
+    # ijson pulls out 'experiment_information' here, and the articles are
+    # streamed one at a time below. Peak parse memory is bounded by the
+    # in-flight submission window of the scoring pool.
+    # use_float=True: ijson otherwise yields decimal.Decimal for JSON floats
+    # (e.g. the steering strengths), which orjson refuses to serialize when
+    # the output is written
     try:
-        with open(input_file_path, 'r', encoding='utf-8') as f:
-            input_data = json.load(f)
-        logger.info(f"Successfully loaded data from {input_file_path}")
-
-        # Basic validation of expected keys
-        if 'experiment_information' not in input_data or 'generated_summaries' not in input_data:
-            logger.error("Input JSON is missing required keys: 'experiment_information' or 'generated_summaries'")
-            return None
-        if not isinstance(input_data['generated_summaries'], dict):
-            logger.error("'generated_summaries' should be a dictionary keyed by article_idx (as string). Found type: %s", type(input_data['generated_summaries']))
+        with open(input_file_path, 'rb') as f:
+            experiment_information = next(ijson.items(f, 'experiment_information', use_float=True), None)
+        if experiment_information is None:
+            logger.error("Input JSON is missing required key: 'experiment_information'")
             return None
-            
+        # Record provenance so a scores-only output can always be joined back
+        # to the generations it was computed from
+        experiment_information = {**experiment_information, 'source_file': input_file_path}
     except FileNotFoundError:
         logger.error(f"Input file not found: {input_file_path}")
         return None
-    except json.JSONDecodeError as e:
+    except ijson.JSONError as e:
         logger.error(f"Error decoding JSON from file: {input_file_path} - {e}")
         return None
     except Exception as e:
         logger.error(f"An unexpected error occurred while reading the input file: {e}", exc_info=True)
         return None
 
-    # --- 3. Prepare Output Structure ---
-    output_data = {
-        'experiment_information': input_data['experiment_information'],
-        'generated_summaries': input_data['generated_summaries'],
-        'scored_summaries': {}  # Initialize empty dict for scores
-    }
+    # --- 2. Load Resume Cache ---
+    # The sidecar is NDJSON, one [cache_key, scores] pair per line: new
+    # entries are appended as they are computed, so persisting a score costs
+    # one line of I/O instead of re-serializing the whole cache each flush
+    resume_cache: Dict[str, Dict[str, Any]] = {}
+    if cache_file_path is not None and os.path.exists(cache_file_path):
+        try:
+            torn_lines = 0
+            with open(cache_file_path, 'rb') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        cache_key, cached_score = orjson.loads(line)
+                    except orjson.JSONDecodeError:
+                        # A crash mid-append leaves a torn trailing line; the
+                        # affected summary is simply rescored
+                        torn_lines += 1
+                        continue
+                    resume_cache[cache_key] = cached_score
+            if torn_lines:
+                logger.warning(f"Skipped {torn_lines} unparseable line(s) in resume cache {cache_file_path}")
+            logger.info(f"Loaded {len(resume_cache)} cached scores from {cache_file_path}")
+        except Exception as e:
+            logger.warning(f"Could not load resume cache {cache_file_path}: {e}. Starting fresh.")
+            resume_cache = {}
+
+    # --- 3. Stream Articles Into Scoring Jobs ---
+    # Articles are held in 'pending' (insertion-ordered) between being parsed
+    # and their pool result arriving, so results can be yielded in input order
+    # including articles that produced no scoring job. The bounded submission
+    # window below caps how many articles are pending at once.
+    pending: Dict[str, Optional[Dict[str, Any]]] = {}
+    # Maps (article_idx_str, strength_str) of in-flight jobs to their cache key
+    cache_keys: Dict[Tuple[str, str], str] = {}
+    # Input fields per in-flight article, kept only when include_inputs is set
+    article_inputs: Dict[str, Dict[str, Any]] = {}
+
+    def _iter_jobs() -> Iterator[Tuple[str, List[str], List[str], Optional[int], Optional[int],
+                                       Optional[str], Optional[str]]]:
+        with open(input_file_path, 'rb') as f:
+            for article_idx_str, article_data in ijson.kvitems(f, 'generated_summaries', use_float=True):
+                # Interned: the key recurs in pending, cache_keys, job tuples
+                # and the output framing, so all of them share one str object
+                article_idx_str = sys.intern(article_idx_str)
+                article_scores: Dict[str, Optional[Dict[str, Any]]] = {} # Scores for this article
+                article_strength_strs: List[str] = []
+                article_texts: List[str] = []
+
+                # Validate the entry's shape against the ArticleData schema in
+                # one pass; tid/reference types and the summaries dict are
+                # checked here, the individual summary values below
+                try:
+                    article = msgspec.convert(article_data, ArticleData, strict=False)
+                except msgspec.ValidationError as e:
+                    logger.warning(f"Article {article_idx_str}: malformed entry ({e}). Skipping scoring for this article.")
+                    pending[article_idx_str] = None # Mark article as unscorable
+                    continue
+
+                tid1, tid2 = article.tid1, article.tid2
+                ref1, ref2 = article.summary1, article.summary2
+
+                if include_inputs:
+                    article_inputs[article_idx_str] = {
+                        'tid1': tid1, 'tid2': tid2,
+                        'summary1': ref1, 'summary2': ref2,
+                        'summaries': article.summaries,
+                    }
+
+                # The same few strength labels repeat across every article, so
+                # interning them collapses thousands of key copies into one
+                # object per label and makes later dict lookups pointer-fast.
+                # Non-string summaries are dropped per strength with one
+                # aggregated warning; the article's other strengths still score
+                items = [(sys.intern(strength_str), generated_text)
+                         for strength_str, generated_text in article.summaries.items()
+                         if isinstance(generated_text, str)]
+                if len(items) != len(article.summaries):
+                    skipped_strengths = [strength_str
+                                         for strength_str, generated_text in article.summaries.items()
+                                         if not isinstance(generated_text, str)]
+                    logger.warning(f"Article {article_idx_str}: Generated text is not a string for strengths {skipped_strengths}. Skipping scoring for these summaries.")
+                    for strength_str in skipped_strengths:
+                        article_scores[strength_str] = None
 
-    # --- 4. Iterate and Score ---
-    total_articles = len(input_data['generated_summaries'])
-    processed_articles = 0
-    logger.info(f"Starting to score summaries for {total_articles} articles.")
-
-    for article_idx_str, article_data in input_data['generated_summaries'].items():
-        processed_articles += 1
-        logger.info(f"Processing article {processed_articles}/{total_articles} (ID: {article_idx_str})")
-        
-        article_scores: Dict[str, Optional[Dict[str, Any]]] = {} # Scores for this article
-
-        # Extract necessary info (handle potential missing keys gracefully)
-        tid1 = article_data.get('tid1')
-        tid2 = article_data.get('tid2')
-        ref1 = article_data.get('summary1')
-        ref2 = article_data.get('summary2')
-        summaries_to_score = article_data.get('summaries', {})
-
-        if not isinstance(summaries_to_score, dict):
-            logger.warning(f"Article {article_idx_str}: 'summaries' field is not a dictionary. Skipping scoring for this article.")
-            output_data['scored_summaries'][article_idx_str] = None # Mark article as unscorable
-            continue
-
-        for strength_str, generated_text in summaries_to_score.items():
-            if not isinstance(generated_text, str):
-                 logger.warning(f"Article {article_idx_str}, Strength {strength_str}: Generated text is not a string ('{type(generated_text)}'). Skipping scoring for this summary.")
-                 article_scores[strength_str] = None
-                 continue
-                 
-            try:
-                # Call the scorer's method for individual text scoring
-                # Rely on default arguments within score_individual_text for 
-                # topic_method and distinct_n
-                score_dict = scorer.score_individual_text(
-                    text=generated_text,
-                    tid1=tid1,
-                    tid2=tid2,
-                    reference_text1=ref1,
-                    reference_text2=ref2
-                    # No topic_method or distinct_n passed here
-                )
-                article_scores[strength_str] = score_dict
-
-            except Exception as e:
-                logger.error(f"Error scoring article {article_idx_str}, strength {strength_str}: {e}", exc_info=False)
-                article_scores[strength_str] = None
-
-        output_data['scored_summaries'][article_idx_str] = article_scores
-
-    logger.info(f"Finished scoring all articles. Results generated for {len(output_data['scored_summaries'])} articles.")
-    return output_data
+                for strength_str, generated_text in items:
+                    # Empty/degenerate generations get a zero-filled score
+                    # dict immediately instead of a full scoring pass
+                    if not generated_text.strip():
+                        logger.warning(f"Article {article_idx_str}, Strength {strength_str}: Generated text is empty. Assigning zero-filled scores.")
+                        article_scores[strength_str] = _empty_text_scores(
+                            generated_text, tid1, tid2, ref1, ref2)
+                        continue
+
+                    # Serve already-scored summaries straight from the resume
+                    # cache; only uncached texts are sent to the pool
+                    cache_key = _resume_cache_key(article_idx_str, strength_str,
+                                                  generated_text, tid1, tid2)
+                    cached_score = resume_cache.get(cache_key)
+                    if cached_score is not None:
+                        article_scores[strength_str] = cached_score
+                        continue
+
+                    article_scores[strength_str] = None # Placeholder until the pool result arrives
+                    cache_keys[(article_idx_str, strength_str)] = cache_key
+                    article_strength_strs.append(strength_str)
+                    article_texts.append(generated_text)
+
+                pending[article_idx_str] = article_scores
+                if article_texts:
+                    # One job per article so the worker can batch-score all strengths
+                    yield (article_idx_str, article_strength_strs, article_texts,
+                           tid1, tid2, ref1, ref2)
+
+    # --- 4. Score in Parallel, Yielding Completed Articles ---
+    # Each worker loads its own Scorer once via _init_worker, then the articles
+    # are scattered across the pool and reassembled by (article_idx_str, strength_str)
+    def _iter_scored_articles() -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        logger.info(f"Streaming articles into {os.cpu_count()} worker processes.")
+        completed_jobs = 0
+        completed_articles = 0
+
+        def _package(article_idx_str: str,
+                     article_scores: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+            # With include_inputs the article's input fields ride along with
+            # its scores. In the scores-only layout the generated text and
+            # reference summaries embedded in every per-strength score dict
+            # are dropped too — otherwise both references would be duplicated
+            # once per strength; the source_file recorded in
+            # experiment_information links the scores back to the inputs
+            if not include_inputs:
+                if article_scores:
+                    for score_dict in article_scores.values():
+                        if score_dict:
+                            for key in ('text', 'reference_text1_used', 'reference_text2_used'):
+                                score_dict.pop(key, None)
+                return article_scores
+            packaged = article_inputs.pop(article_idx_str, {})
+            packaged['scored_summaries'] = article_scores
+            return packaged
+
+        # Futures are submitted by hand with a bounded in-flight window:
+        # executor.map would exhaust the job generator (and with it the whole
+        # input file) before yielding its first result, buffering every
+        # article's generated texts in the executor at once
+        max_workers = os.cpu_count()
+        window_size = 2 * max_workers
+        cache_fh = open(cache_file_path, 'ab') if cache_file_path is not None else None
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+                jobs = _iter_jobs()
+                in_flight = deque(executor.submit(_score_article, job)
+                                  for job in islice(jobs, window_size))
+                while in_flight:
+                    article_idx_str, article_scores = in_flight.popleft().result()
+                    next_job = next(jobs, None)
+                    if next_job is not None:
+                        in_flight.append(executor.submit(_score_article, next_job))
+                    pending[article_idx_str].update(article_scores)
+                    # Append freshly computed scores to the resume cache sidecar
+                    for strength_str, score_dict in article_scores.items():
+                        cache_key = cache_keys.pop((article_idx_str, strength_str), None)
+                        if score_dict is not None and cache_key is not None and cache_fh is not None:
+                            cache_fh.write(orjson.dumps([cache_key, score_dict]) + b"\n")
+                    completed_jobs += 1
+                    if cache_fh is not None and completed_jobs % _CACHE_FLUSH_INTERVAL == 0:
+                        cache_fh.flush()
+                    # Everything parsed before this article is complete now:
+                    # jobs come back in submission order, and earlier articles
+                    # without a job were finalized at parse time
+                    while pending:
+                        completed_idx_str = next(iter(pending))
+                        yield completed_idx_str, _package(completed_idx_str,
+                                                          pending.pop(completed_idx_str))
+                        completed_articles += 1
+                        if completed_articles % _PROGRESS_LOG_INTERVAL == 0:
+                            logger.info(f"Scored {completed_articles} articles.")
+                        if completed_idx_str == article_idx_str:
+                            break
+        except ijson.JSONError as e:
+            logger.error(f"Error decoding JSON from file: {input_file_path} - {e}")
+            return
+        except Exception as e:
+            logger.error(f"Fatal Error: Scoring pool failed: {e}", exc_info=True)
+            return
+        finally:
+            if cache_fh is not None:
+                cache_fh.close()
+        # Trailing articles that produced no scoring job
+        for article_idx_str, article_scores in pending.items():
+            yield article_idx_str, _package(article_idx_str, article_scores)
+            completed_articles += 1
+        logger.info(f"Finished scoring all {completed_articles} articles.")
+
+    return experiment_information, _iter_scored_articles()
+
+def _writer_loop(write_queue: "queue.Queue", output_fh,
+                 write_errors: List[Exception]) -> None:
+    """
+    Serializes and writes scored articles handed over from the main thread.
+
+    Runs on a background thread: the main thread only enqueues
+    (article_idx_str, article_scores) pairs, so orjson serialization and disk
+    writes overlap with collecting the next pool result instead of stalling
+    it. A None sentinel ends the loop. A failed write (disk full, closed
+    handle) is stashed in write_errors and the loop keeps draining the queue
+    so the producer can never block on a full queue; the caller re-raises
+    after joining the thread.
+    """
+    article_num = 0
+    while True:
+        item = write_queue.get()
+        if item is None:
+            break
+        if write_errors:
+            continue # Drain only; a write already failed
+        article_idx_str, article_scores = item
+        try:
+            if article_num > 0:
+                output_fh.write(b', ')
+            output_fh.write(orjson.dumps(article_idx_str))
+            output_fh.write(b': ')
+            output_fh.write(orjson.dumps(article_scores, option=orjson.OPT_NON_STR_KEYS))
+            article_num += 1
+        except Exception as e:
+            logger.error(f"Background writer failed to write article {article_idx_str}: {e}", exc_info=False)
+            write_errors.append(e)
 
 def main() -> None:
     # load results and scores paths from environment variables
@@ -134,13 +468,47 @@ def main() -> None:
     file_path = 'toxicity_vectors_with_prompts/toxicity_summaries_llama3_3b_NEWTS_test_100_articles_words_20250515_155443.json'
 
     input_json_path = os.path.join(results_path, file_path)
+    output_json_path = os.path.join(scores_path, file_path)
 
-    scored_summaries = score_newts_summaries(input_json_path)
+    # The resume cache lets a rerun (after a crash, or with new strengths
+    # added) skip every summary that was already scored
+    result = score_newts_summaries(input_json_path,
+                                   cache_file_path=f"{output_json_path}.cache.ndjson")
+    if result is None:
+        logger.error("Scoring failed; no output written.")
+        return
+    experiment_information, scored_articles = result
 
-    # Save the scored summaries to a new JSON file
-    output_json_path = os.path.join(scores_path, file_path)
-    with open(output_json_path, 'w', encoding='utf-8') as f:
-        json.dump(scored_summaries, f, ensure_ascii=False, indent=2)
+    # Stream the scored summaries to the output file article by article; each
+    # article's scores are written (and parsed-input memory released) as soon
+    # as its pool result arrives, so the full output dict is never
+    # materialized. Serialization and disk writes run on a daemon writer
+    # thread fed through a bounded queue, keeping the consuming loop free to
+    # pull the next pool result while the previous article hits the disk.
+    with open(output_json_path, 'wb') as f:
+        f.write(b'{"experiment_information": ')
+        f.write(orjson.dumps(experiment_information))
+        f.write(b', "scored_summaries": {')
+        write_queue: "queue.Queue" = queue.Queue(maxsize=16)
+        write_errors: List[Exception] = []
+        writer = threading.Thread(target=_writer_loop, args=(write_queue, f, write_errors),
+                                  daemon=True)
+        writer.start()
+        try:
+            for article_idx_str, article_scores in scored_articles:
+                write_queue.put((article_idx_str, article_scores))
+        finally:
+            # Sentinel stops the writer; join before the closing braces so
+            # every queued article is on disk first
+            write_queue.put(None)
+            writer.join()
+        # A failed write means the file is truncated mid-article: re-raise
+        # instead of closing the braces and logging success on a broken file
+        if write_errors:
+            raise write_errors[0]
+        f.write(b'}}')
+
+    logger.info(f"Successfully saved scored summaries to {output_json_path}")
 
 
 if __name__ == '__main__':
@@ -10,7 +10,7 @@ reuse loaded models and resources.
 
 # Standard library imports
 import logging
-from typing import Dict, Optional, Any
+from typing import Any, Dict, List, Optional
 
 from config.score_and_plot_config import ScoreAndPlotConfig
 
@@ -74,6 +74,23 @@ class Scorer:
             # Re-raise the exception to signal critical failure
             raise
 
+    @staticmethod
+    def _log_scoring_error(err_counts: Dict[str, int], stage: str, error: Exception) -> None:
+        """
+        Logs a scoring error, rate-limited per (stage, exception type).
+
+        A systematic sub-scorer failure would otherwise emit one error line
+        per text per stage, stalling the scoring loop on log I/O: the first
+        occurrence is logged at ERROR, repeats only at DEBUG, and the caller
+        can summarize the suppressed count afterwards via err_counts.
+        """
+        error_key = f"{stage}:{type(error).__name__}"
+        err_counts[error_key] = err_counts.get(error_key, 0) + 1
+        if err_counts[error_key] == 1:
+            logger.error(f"Error during {stage} scoring: {error}", exc_info=False)
+        else:
+            logger.debug(f"Error during {stage} scoring (repeat): {error}")
+
     def score_individual_text(self,
                               text: str,
                               tid1: Optional[int] = None,
@@ -81,7 +98,9 @@ class Scorer:
                               reference_text1: Optional[str] = None,
                               reference_text2: Optional[str] = None,
                               topic_method: str = None,
-                              distinct_n: int = 2 # Default n for distinct n-grams
+                              distinct_n: int = 2, # Default n for distinct n-grams
+                              topic_resources: Optional[Dict[int, Dict[str, Any]]] = None,
+                              err_counts: Optional[Dict[str, int]] = None
                              ) -> Dict[str, Any]:
         """
         Scores a single text using the configured and initialized scorers.
@@ -103,6 +122,12 @@ class Scorer:
                                 both tid1 and tid2 if provided. Defaults to 'lemmatize'.
             distinct_n (int): The 'n' value for the Distinct-N calculation within
                               intrinsic quality scoring. Defaults to 2.
+            topic_resources (Optional[Dict[int, Dict[str, Any]]]): Precomputed topic
+                              artifacts keyed by tid, as built by prepare_article_context.
+                              Fetched per call when not provided.
+            err_counts (Optional[Dict[str, int]]): Shared per-article error counter for
+                              rate-limited error logging; a fresh counter is used when
+                              not provided.
 
         Returns:
             Dict[str, Any]: A dictionary containing the input text, identifiers used,
@@ -113,7 +138,10 @@ class Scorer:
         if not isinstance(text, str):
              logger.warning("Input 'text' is not a string. Skipping scoring.")
              return {"text": text, "error": "Input text must be a string."}
-             
+
+        if err_counts is None:
+            err_counts = {}
+
         logger.debug(f"Scoring text (first 50 chars): '{text[:50]}...'")
         scores: Dict[str, Any] = {"text": text}
         if tid1 is not None:
@@ -149,31 +177,36 @@ class Scorer:
             sentiment_scores_dict = self.sentiment_scorer.get_normalized_scores(text)
             scores['sentiment_scores'] = sentiment_scores_dict
         except Exception as e:
-            logger.error(f"Error during sentiment scoring: {e}", exc_info=False)
+            self._log_scoring_error(err_counts, 'sentiment', e)
 
         # 2. Intrinsic Quality Scoring (Always runs if text is valid)
         try:
             intrinsic_scores_dict = self.intrinsic_scorer.get_intrinsic_scores(text, n_value=distinct_n)
             scores['intrinsic_scores'].update(intrinsic_scores_dict)
         except Exception as e:
-            logger.error(f"Error during intrinsic scoring: {e}", exc_info=False)
+            self._log_scoring_error(err_counts, 'intrinsic', e)
 
         # 3. Topic Scoring (Conditional on tid)
+        topic_resources = topic_resources or {}
         if tid1 is not None:
             try:
-                topic_scores_tid1_dict = self.topic_scorer.get_topic_score(text=text, tid=tid1, method=topic_method)
+                topic_scores_tid1_dict = self.topic_scorer.get_topic_score(
+                    text=text, tid=tid1, method=topic_method,
+                    resources=topic_resources.get(tid1))
                 scores['topic_scores']['tid1'] = topic_scores_tid1_dict
             except Exception as e:
-                logger.error(f"Unexpected error during topic scoring for tid {tid1}: {e}", exc_info=False)
+                self._log_scoring_error(err_counts, f'topic (tid {tid1})', e)
         else:
             logger.debug("Topic ID (tid) not provided, skipping topic scoring.")
 
         if tid2 is not None:
             try:
-                topic_scores_tid2_dict = self.topic_scorer.get_topic_score(text=text, tid=tid2, method=topic_method)
+                topic_scores_tid2_dict = self.topic_scorer.get_topic_score(
+                    text=text, tid=tid2, method=topic_method,
+                    resources=topic_resources.get(tid2))
                 scores['topic_scores']['tid2'] = topic_scores_tid2_dict
             except Exception as e:
-                logger.error(f"Unexpected error during topic scoring for tid {tid2}: {e}", exc_info=False)
+                self._log_scoring_error(err_counts, f'topic (tid {tid2})', e)
         else:
             logger.debug("Topic ID (tid) not provided, skipping topic scoring.")
 
@@ -186,7 +219,7 @@ class Scorer:
                 )
                 scores['extrinsic_scores']['reference_text1'] = extrinsic_scores1_dict
             except Exception as e:
-                logger.error(f"Error during extrinsic scoring: {e}", exc_info=False)
+                self._log_scoring_error(err_counts, 'extrinsic (reference_text1)', e)
 
         if reference_text2 is not None:
             try:
@@ -196,21 +229,197 @@ class Scorer:
                 )
                 scores['extrinsic_scores']['reference_text2'] = extrinsic_scores2_dict
             except Exception as e:
-                logger.error(f"Error during extrinsic scoring: {e}", exc_info=False)
+                self._log_scoring_error(err_counts, 'extrinsic (reference_text2)', e)
 
         # 5. Readability Scoring (Always runs if text is valid)
         try:
             readability_scores_dict = self.readability_scorer.get_readability_scores(text)
             scores['readability_scores'] = readability_scores_dict
         except Exception as e:
-            logger.error(f"Error during readability scoring: {e}", exc_info=False)
+            self._log_scoring_error(err_counts, 'readability', e)
 
         # 6. Toxicity Scoring (Always runs if text is valid)
         try:
             toxicity_scores_dict = self.toxicity_scorer.get_toxicity_scores(text)
             scores['toxicity_scores'] = toxicity_scores_dict
         except Exception as e:
-            logger.error(f"Error during toxicity scoring: {e}", exc_info=False)
+            self._log_scoring_error(err_counts, 'toxicity', e)
 
         logger.debug(f"Finished scoring text (first 50 chars): '{text[:50]}...'")
-        return scores
\ No newline at end of file
+        return scores
+
+    def prepare_article_context(self,
+                                tid1: Optional[int] = None,
+                                tid2: Optional[int] = None,
+                                reference_text1: Optional[str] = None,
+                                reference_text2: Optional[str] = None
+                               ) -> Dict[str, Any]:
+        """
+        Precomputes the per-article artifacts shared by every text scored for
+        that article (e.g. all steering strengths of one summary set).
+
+        Validates the reference texts once and fetches the topic artifacts for
+        tid1/tid2 once, so repeated score_with_context calls skip the per-call
+        LDA and tokenizer lookups.
+
+        Args:
+            tid1 (Optional[int]): First topic ID shared by the article's texts.
+            tid2 (Optional[int]): Second topic ID shared by the article's texts.
+            reference_text1 (Optional[str]): First shared reference text.
+            reference_text2 (Optional[str]): Second shared reference text.
+
+        Returns:
+            Dict[str, Any]: A context dictionary for score_with_context.
+        """
+        if reference_text1 is not None and not isinstance(reference_text1, str):
+            logger.warning("Input 'reference_text1' is not a string. Skipping extrinsic scoring.")
+            reference_text1 = None
+        if reference_text2 is not None and not isinstance(reference_text2, str):
+            logger.warning("Input 'reference_text2' is not a string. Skipping extrinsic scoring.")
+            reference_text2 = None
+
+        topic_resources: Dict[int, Dict[str, Any]] = {}
+        for tid in (tid1, tid2):
+            if tid is not None and tid not in topic_resources:
+                try:
+                    topic_resources[tid] = self.topic_scorer.get_topic_resources(tid)
+                except Exception as e:
+                    logger.error(f"Error preparing topic resources for tid {tid}: {e}", exc_info=False)
+
+        return {
+            'tid1': tid1,
+            'tid2': tid2,
+            'reference_text1': reference_text1,
+            'reference_text2': reference_text2,
+            'topic_resources': topic_resources,
+        }
+
+    def score_with_context(self,
+                           text: str,
+                           context: Dict[str, Any],
+                           topic_method: str = None,
+                           distinct_n: int = 2
+                          ) -> Dict[str, Any]:
+        """
+        Scores a single text using a context built by prepare_article_context.
+
+        Equivalent to score_individual_text with the context's topic IDs and
+        reference texts, but reuses the precomputed topic artifacts instead of
+        refetching them for every text.
+
+        Args:
+            text (str): The input text to score.
+            context (Dict[str, Any]): The context from prepare_article_context.
+            topic_method (str): The method for topic scoring. Defaults to None.
+            distinct_n (int): The 'n' value for Distinct-N. Defaults to 2.
+
+        Returns:
+            Dict[str, Any]: A score dictionary shaped like score_individual_text output.
+        """
+        return self.score_individual_text(
+            text=text,
+            tid1=context['tid1'],
+            tid2=context['tid2'],
+            reference_text1=context['reference_text1'],
+            reference_text2=context['reference_text2'],
+            topic_method=topic_method,
+            distinct_n=distinct_n,
+            topic_resources=context['topic_resources']
+        )
+
+    def score_individual_texts(self,
+                               texts: List[str],
+                               tid1: Optional[int] = None,
+                               tid2: Optional[int] = None,
+                               reference_text1: Optional[str] = None,
+                               reference_text2: Optional[str] = None,
+                               topic_method: str = None,
+                               distinct_n: int = 2,
+                               topic_resources: Optional[Dict[int, Dict[str, Any]]] = None
+                              ) -> List[Dict[str, Any]]:
+        """
+        Scores several texts that share the same topic IDs and reference texts,
+        e.g. all summary variations generated for one article.
+
+        The extrinsic (BERTScore) comparisons against each reference are run as
+        one batched forward pass over all texts instead of once per text; the
+        remaining per-text scorers are applied individually.
+
+        Args:
+            texts (List[str]): The input texts to score.
+            tid1 (Optional[int]): First topic ID shared by all texts. Defaults to None.
+            tid2 (Optional[int]): Second topic ID shared by all texts. Defaults to None.
+            reference_text1 (Optional[str]): First shared reference text. Defaults to None.
+            reference_text2 (Optional[str]): Second shared reference text. Defaults to None.
+            topic_method (str): The method for topic scoring. Defaults to None.
+            distinct_n (int): The 'n' value for Distinct-N. Defaults to 2.
+            topic_resources (Optional[Dict[int, Dict[str, Any]]]): Precomputed topic
+                              artifacts keyed by tid, as built by prepare_article_context.
+                              Fetched per call when not provided.
+
+        Returns:
+            List[Dict[str, Any]]: One score dictionary per input text, in input
+                                  order, shaped like score_individual_text output.
+        """
+        if reference_text1 is not None and not isinstance(reference_text1, str):
+            logger.warning("Input 'reference_text1' is not a string. Skipping extrinsic scoring.")
+            reference_text1 = None
+        if reference_text2 is not None and not isinstance(reference_text2, str):
+            logger.warning("Input 'reference_text2' is not a string. Skipping extrinsic scoring.")
+            reference_text2 = None
+
+        # Batch the transformer-based extrinsic scoring across all valid texts up front
+        scorable_indices = [text_num for text_num, text in enumerate(texts) if isinstance(text, str)]
+        scorable_texts = [texts[text_num] for text_num in scorable_indices]
+        extrinsic_scores1: Dict[int, Dict[str, float]] = {}
+        extrinsic_scores2: Dict[int, Dict[str, float]] = {}
+        if scorable_texts and reference_text1 is not None:
+            try:
+                batch_scores = self.extrinsic_scorer.get_similarity_scores_batch(
+                    generated_texts=scorable_texts, reference_text=reference_text1)
+                extrinsic_scores1 = dict(zip(scorable_indices, batch_scores))
+            except Exception as e:
+                logger.error(f"Error during batched extrinsic scoring: {e}", exc_info=False)
+        if scorable_texts and reference_text2 is not None:
+            try:
+                batch_scores = self.extrinsic_scorer.get_similarity_scores_batch(
+                    generated_texts=scorable_texts, reference_text=reference_text2)
+                extrinsic_scores2 = dict(zip(scorable_indices, batch_scores))
+            except Exception as e:
+                logger.error(f"Error during batched extrinsic scoring: {e}", exc_info=False)
+
+        # Score the per-text metrics individually and merge the batched
+        # extrinsic results back in, matching score_individual_text's shape.
+        # One shared error counter rate-limits duplicate failures across the
+        # article's texts (first at ERROR, repeats at DEBUG)
+        err_counts: Dict[str, int] = {}
+        all_scores: List[Dict[str, Any]] = []
+        for text_num, text in enumerate(texts):
+            scores = self.score_individual_text(
+                text=text,
+                tid1=tid1,
+                tid2=tid2,
+                reference_text1=None,
+                reference_text2=None,
+                topic_method=topic_method,
+                distinct_n=distinct_n,
+                topic_resources=topic_resources,
+                err_counts=err_counts
+            )
+            if isinstance(text, str):
+                if reference_text1 is not None:
+                    scores["reference_text1_used"] = reference_text1
+                    scores.setdefault('extrinsic_scores', {})
+                    if text_num in extrinsic_scores1:
+                        scores['extrinsic_scores']['reference_text1'] = extrinsic_scores1[text_num]
+                if reference_text2 is not None:
+                    scores["reference_text2_used"] = reference_text2
+                    scores.setdefault('extrinsic_scores', {})
+                    if text_num in extrinsic_scores2:
+                        scores['extrinsic_scores']['reference_text2'] = extrinsic_scores2[text_num]
+            all_scores.append(scores)
+
+        suppressed_errors = sum(count - 1 for count in err_counts.values())
+        if suppressed_errors > 0:
+            logger.info(f"Suppressed {suppressed_errors} similar scoring errors across {len(texts)} texts.")
+        return all_scores
\ No newline at end of file
@@ -6,9 +6,10 @@ It loads necessary resources like LDA models, dictionaries, and tokenizers once.
 """
 
 # Standard library imports
+import functools
 import logging
 import sys
-from typing import Set, List, Tuple, Optional, Dict
+from typing import Any, Set, List, Tuple, Optional, Dict
 
 # Third-party imports
 from gensim.models.ldamodel import LdaModel
@@ -94,10 +95,68 @@ class TopicScorer:
             raise # Re-raise any other critical loading failure
 
         self.num_topic_words = self.config.num_topic_words
+
+        # The same text is scored against both of an article's topic IDs (and
+        # get_topic_score without a method runs all four methods), so memoize
+        # the tid-independent text-side work: tokenizer encoding and
+        # stem/lemmatize processing are computed once per distinct text
+        self._tokenize_text = functools.lru_cache(maxsize=2048)(self._tokenize_text_uncached)
+        self._process_text = functools.lru_cache(maxsize=2048)(self.text_processor.process_text)
+
+        # The tids come from a small fixed topic set (~250 NEWTS topics), so
+        # the per-topic artifacts are built once per tid and served from the
+        # cache on every subsequent scoring call
+        self.get_topic_resources = functools.lru_cache(maxsize=None)(self._build_topic_resources)
+
         logger.info("TopicScorer initialized successfully.")
 
+    def _tokenize_text_uncached(self, text: str) -> Tuple[int, ...]:
+        """Tokenizes the text word by word and flattens the token IDs."""
+        words = text.lower().split()
+        tokenized_text_ids: List[int] = []
+        for word in words:
+            # Use add_special_tokens=False if you don't want BOS/EOS etc. within word tokens
+            word_tokens = self.tokenizer.encode(word, add_special_tokens=False)
+            tokenized_text_ids.extend(word_tokens)
+        return tuple(tokenized_text_ids)
+
+
+    def _build_topic_resources(self, tid: int) -> Dict[str, Any]:
+        """
+        Builds the per-topic artifacts used by the scoring methods.
+
+        Exposed through the cached get_topic_resources (assigned in __init__),
+        so each topic ID pays the LDA and tokenizer lookups exactly once per
+        scorer instance; callers such as Scorer.prepare_article_context simply
+        hit the cache.
+
+        Args:
+            tid (int): The target topic ID.
 
-    def get_topic_score(self, text: str, tid: int, method: Optional[str] = None) -> Dict[str, float]:
+        Returns:
+            Dict[str, Any]: A dictionary with 'token_ids' (frozenset of topic
+                            token IDs), 'word_weights' (word -> weight mapping
+                            of the topic's top words) and 'total_weight'.
+        """
+        token_ids = frozenset(get_topic_tokens(
+            tokenizer=self.tokenizer,
+            lda=self.lda,
+            tid=tid,
+            num_topic_words=self.num_topic_words
+        ))
+        try:
+            word_weights = dict(self.lda.show_topic(tid, topn=self.num_topic_words))
+        except IndexError:
+            logger.error(f"Topic ID {tid} is invalid for the loaded LDA model.")
+            word_weights = {}
+        return {
+            'token_ids': token_ids,
+            'word_weights': word_weights,
+            'total_weight': sum(word_weights.values()),
+        }
+
+    def get_topic_score(self, text: str, tid: int, method: Optional[str] = None,
+                        resources: Optional[Dict[str, Any]] = None) -> Dict[str, float]:
         """
         Calculates the topic score for the given text and topic ID using the specified method.
 
@@ -106,6 +165,8 @@ class TopicScorer:
             tid (int): The target topic ID.
             method (str): The scoring method to use. Must be one of
                           'dict', 'tokenize', 'stem', or 'lemmatize'.
+            resources (Optional[Dict[str, Any]]): Precomputed topic artifacts from
+                          get_topic_resources; fetched per call when not provided.
 
         Returns:
             float: The calculated topic score.
@@ -132,16 +193,21 @@ class TopicScorer:
         results: Dict[str, float] = {}
 
         try:
+            # Resolve the cached per-topic artifacts when the caller did not
+            # pass precomputed ones, so every method below skips the per-call
+            # LDA and tokenizer lookups
+            if resources is None:
+                resources = self.get_topic_resources(tid)
             for method in methods_to_run:
                 score: float = 0.0
                 if method == 'dict':
                     score = self._calculate_dict_score(text, tid)
                 elif method == 'tokenize':
-                    score = self._calculate_tokenize_score(text, tid)
+                    score = self._calculate_tokenize_score(text, tid, resources)
                 elif method == 'stem':
-                    score = self._calculate_stem_lem_score(text, tid, 'stem')
+                    score = self._calculate_stem_lem_score(text, tid, 'stem', resources)
                 elif method == 'lemmatize':
-                    score = self._calculate_stem_lem_score(text, tid, 'lemmatize')
+                    score = self._calculate_stem_lem_score(text, tid, 'lemmatize', resources)
                 results[method] = score
         except ZeroDivisionError as e:
             logger.error(f"Calculation error for method '{method}', tid {tid}: Division by zero. Text: '{text[:50]}...'")
@@ -174,28 +240,27 @@ class TopicScorer:
         return score
 
 
-    def _calculate_tokenize_score(self, text: str, tid: int) -> float:
+    def _calculate_tokenize_score(self, text: str, tid: int,
+                                  resources: Optional[Dict[str, Any]] = None) -> float:
         """Calculates topic score based on tokenizer tokens."""
         logger.debug(f"Calculating 'tokenize' score for tid {tid}")
         # Get the set of token IDs for the target topic
-        topic_token_ids: Set[int] = set(get_topic_tokens(
-            tokenizer=self.tokenizer,
-            lda=self.lda,
-            tid=tid,
-            num_topic_words=self.num_topic_words
-        ))
+        if resources is not None:
+            topic_token_ids: Set[int] = resources['token_ids']
+        else:
+            topic_token_ids = set(get_topic_tokens(
+                tokenizer=self.tokenizer,
+                lda=self.lda,
+                tid=tid,
+                num_topic_words=self.num_topic_words
+            ))
 
         if not topic_token_ids:
             logger.warning(f"No topic tokens found for tid {tid}. Returning score 0.0.")
             return 0.0
 
-        # Tokenize the input text word by word and flatten
-        words = text.lower().split()
-        tokenized_text_ids = []
-        for word in words:
-            # Use add_special_tokens=False if you don't want BOS/EOS etc. within word tokens
-            word_tokens = self.tokenizer.encode(word, add_special_tokens=False)
-            tokenized_text_ids.extend(word_tokens)
+        # Tokenize the input text (memoized, shared across tids and methods)
+        tokenized_text_ids = self._tokenize_text(text)
 
         if not tokenized_text_ids:
             logger.warning(f"Text resulted in zero tokens after tokenization: '{text[:50]}...'")
@@ -212,32 +277,36 @@ class TopicScorer:
         return normalized_score
 
 
-    def _calculate_stem_lem_score(self, text: str, tid: int, process_method: str) -> float:
+    def _calculate_stem_lem_score(self, text: str, tid: int, process_method: str,
+                                  resources: Optional[Dict[str, Any]] = None) -> float:
         """Calculates topic score based on stemmed or lemmatized words."""
         logger.debug(f"Calculating '{process_method}' score for tid {tid}")
         # Process the text using the specified method (stem or lemmatize)
         # This removes stopwords and punctuation as per TextProcessor logic
-        processed_words: Set[str] = self.text_processor.process_text(text, process_method)
+        # (memoized, shared across tids)
+        processed_words: Set[str] = self._process_text(text, process_method)
 
         if not processed_words:
             logger.warning(f"Text resulted in zero processed words using method '{process_method}': '{text[:50]}...'")
             return 0.0  # Return 0 instead of raising error
 
         # Get the top N words and their weights for the target topic
-        try:
-            # Note: show_topic returns list of (word, weight) tuples
-            topic_words_with_weights = dict(self.lda.show_topic(tid, topn=self.num_topic_words))
-        except IndexError:
-             logger.error(f"Topic ID {tid} is invalid for the loaded LDA model.")
-             return 0.0  # Return 0 instead of raising error
+        if resources is not None:
+            topic_words_with_weights = resources['word_weights']
+            total_weight = resources['total_weight']
+        else:
+            try:
+                # Note: show_topic returns list of (word, weight) tuples
+                topic_words_with_weights = dict(self.lda.show_topic(tid, topn=self.num_topic_words))
+            except IndexError:
+                logger.error(f"Topic ID {tid} is invalid for the loaded LDA model.")
+                return 0.0  # Return 0 instead of raising error
+            total_weight = sum(topic_words_with_weights.values())
 
         if not topic_words_with_weights:
              logger.warning(f"LDA model returned no words for tid {tid}. Returning score 0.0.")
              return 0.0
 
-        # Calculate the total weight of the topic's top words
-        total_weight = sum(topic_words_with_weights.values())
-
         if total_weight == 0.0:
             logger.warning(f"Total weight for top words of tid {tid} is zero.")
             return 0.0  # Return 0 instead of raising error
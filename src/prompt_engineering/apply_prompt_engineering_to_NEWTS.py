@@ -100,13 +100,13 @@ def generate_newts_summaries(
         with torch.no_grad():
             for article_idx_loop in range(min(len(dataset), num_articles)):
                 article_data = dataset[article_idx_loop]
-                article_actual_idx = int(article_data['article_idx']) 
-                docId = article_data['docId']
-                article = article_data['article']
-                tid1 = article_data['tid1']
-                tid2 = article_data['tid2']
-                original_summary1 = article_data['summary1']
-                original_summary2 = article_data['summary2']
+                article_actual_idx = int(article_data.article_idx)
+                docId = article_data.docId
+                article = article_data.article
+                tid1 = article_data.tid1
+                tid2 = article_data.tid2
+                original_summary1 = article_data.summary1
+                original_summary2 = article_data.summary2
                 
                 current_article_results: Dict[str, Any] = {
                     'docId': docId,
@@ -23,6 +23,7 @@ from .compute_properties_of_activations import (
 
 from .generation_utils import (
     generate_text_with_steering_vector,
+    generate_texts_with_steering_vector_batched,
     generate_text_without_steering_vector,
 )
 
@@ -112,6 +113,7 @@ __all__ = [
     "compute_l2_norms_dict",
     # generation utils
     "generate_text_with_steering_vector",
+    "generate_texts_with_steering_vector_batched",
     "generate_text_without_steering_vector",
     # get basic
     "get_device",
@@ -8,11 +8,12 @@ AutoModelForCausalLM class in the transformers library and tokenizer from the Au
 import os
 import sys
 import logging
-from typing import Dict, Union
+from typing import Dict, List, Union
 
 # Third-party imports
 import torch
-from transformers import AutoTokenizer, AutoModelForCausalLM, GenerationConfig
+from transformers import AutoTokenizer, AutoModelForCausalLM, BatchEncoding, GenerationConfig
+from transformers.cache_utils import DynamicCache
 from steering_vectors import SteeringVector
 
 # Local imports
@@ -84,6 +85,149 @@ def generate_text_with_steering_vector(
 
     return generated_text
 
+def _get_decoder_layers(model: AutoModelForCausalLM) -> torch.nn.ModuleList:
+    """
+    Resolves the list of decoder blocks for the common causal LM architectures
+    used in this project (Llama, Gemma, Falcon, Mistral, OpenELM, GPT-NeoX).
+
+    Args:
+        model: The causal language model.
+
+    Returns:
+        The ModuleList containing the model's decoder blocks.
+
+    Raises:
+        ValueError: If no known decoder block attribute path matches the model.
+    """
+    for attr_path in ("model.layers", "transformer.h", "gpt_neox.layers",
+                      "model.decoder.layers", "transformer.layers"):
+        module = model
+        try:
+            for attr in attr_path.split("."):
+                module = getattr(module, attr)
+            return module
+        except AttributeError:
+            continue
+    raise ValueError(f"Could not locate decoder layers for model of type {type(model).__name__}")
+
+def _make_batched_steering_hook(steering_tensor: torch.Tensor, strengths: torch.Tensor):
+    """
+    Builds a forward hook that adds a per-row multiple of the steering vector to
+    the hidden states, i.e. hidden += strengths[:, None, None] * steering_tensor.
+    This lets one batched forward pass cover several steering strengths at once.
+    """
+    def hook(_module, _inputs, output):
+        hidden = output[0] if isinstance(output, tuple) else output
+        scale = strengths.to(device=hidden.device, dtype=hidden.dtype)
+        vec = steering_tensor.to(device=hidden.device, dtype=hidden.dtype)
+        steered = hidden + scale[:, None, None] * vec
+        if isinstance(output, tuple):
+            return (steered,) + output[1:]
+        return steered
+    return hook
+
+def generate_texts_with_steering_vector_batched(
+    model: AutoModelForCausalLM,
+    tokenizer: AutoTokenizer,
+    prompt: Union[str, BatchEncoding],
+    steering_vector: SteeringVector,
+    steering_strengths: List[float],
+    device: torch.device,
+    max_new_tokens: int = 256,
+    **generation_kwargs
+) -> List[str]:
+    """
+    Generates text for all steering strengths of one prompt in a single batched
+    model.generate call, returning only the newly generated text per strength.
+
+    Since the steering strength is just a scalar multiplier on the same vector,
+    the batch holds one row per strength and the forward hook broadcasts a
+    per-row strength tensor over the shared steering vector. This replaces
+    len(steering_strengths) sequential generation loops with one forward pass
+    per decoded token.
+
+    Args:
+        model: The causal language model.
+        tokenizer: The tokenizer associated with the model.
+        prompt: The input prompt shared across all strengths, either as a raw
+            string or as an already tokenized BatchEncoding (ideally pinned,
+            so the device copy can run asynchronously).
+        steering_vector: The SteeringVector object to apply.
+        steering_strengths: One steering multiplier per batch row.
+        device: The torch device (e.g., 'cuda', 'cpu').
+        max_new_tokens: The maximum number of new tokens to generate.
+        **generation_kwargs: Additional keyword arguments passed to model.generate().
+
+    Returns:
+        A list of newly generated text strings, ordered like steering_strengths.
+    """
+    # Left padding keeps the generated continuation contiguous with the prompt
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    tokenizer.padding_side = "left"
+
+    batch_size = len(steering_strengths)
+
+    # Tokenize the prompt once (unless the caller pre-tokenized it) and tile it
+    # across the batch; all rows share the same length so no padding tokens are
+    # introduced. The non-blocking copy overlaps with in-flight GPU work when
+    # the source tensors live in pinned memory.
+    encoded = tokenizer(prompt, return_tensors="pt", truncation=True) if isinstance(prompt, str) else prompt
+    prompt_ids = encoded["input_ids"].to(device, non_blocking=True)
+    prompt_mask = encoded["attention_mask"].to(device, non_blocking=True)
+    input_ids = prompt_ids.repeat(batch_size, 1)
+    attention_mask = prompt_mask.repeat(batch_size, 1)
+    input_length = input_ids.shape[1]
+
+    generation_config = {
+        "max_new_tokens": max_new_tokens,
+        "pad_token_id": tokenizer.pad_token_id if tokenizer.pad_token_id is not None else tokenizer.eos_token_id,
+        "eos_token_id": tokenizer.eos_token_id,
+        **generation_kwargs # User-provided kwargs override defaults
+    }
+
+    strengths = torch.tensor(steering_strengths, device=device)
+    decoder_layers = _get_decoder_layers(model)
+
+    # Prefill the prompt once on a single row with no steering hooks: the prompt
+    # tokens are identical for every strength, so the steered decode phase can
+    # start from a shared KV cache instead of re-encoding the prompt per row.
+    # This drops prefill compute from B*L to L forward-token-equivalents.
+    past_key_values = None
+    if input_length > 1:
+        prefill_outputs = model(input_ids=prompt_ids[:, :-1],
+                                attention_mask=prompt_mask[:, :-1],
+                                use_cache=True)
+        past_key_values = prefill_outputs.past_key_values
+        if isinstance(past_key_values, DynamicCache):
+            past_key_values.batch_repeat_interleave(batch_size)
+        else:
+            past_key_values = tuple(
+                tuple(state.repeat_interleave(batch_size, dim=0) for state in layer_states)
+                for layer_states in past_key_values)
+
+    # Register one hook per steered layer, generate once for the whole batch,
+    # and always remove the hooks again afterwards
+    handles = []
+    try:
+        for layer_num, layer_activation in steering_vector.layer_activations.items():
+            handles.append(decoder_layers[layer_num].register_forward_hook(
+                _make_batched_steering_hook(layer_activation, strengths)))
+        outputs = model.generate(
+            input_ids=input_ids,
+            attention_mask=attention_mask,
+            past_key_values=past_key_values,
+            **generation_config
+        )
+    finally:
+        for handle in handles:
+            handle.remove()
+
+    # Decode only the generated tokens per row and clean up whitespace
+    generated_ids = outputs[:, input_length:]
+    generated_texts = tokenizer.batch_decode(generated_ids.cpu(), skip_special_tokens=True)
+    return [text.strip() for text in generated_texts]
+
 def generate_text_without_steering_vector(
     model: AutoModelForCausalLM,
     tokenizer: AutoTokenizer,
@@ -6,7 +6,8 @@ Utility functions for different datasets including the NEWTS dataset.
 # Standard library imports
 import os
 import logging
-from typing import Dict, Optional
+from collections import namedtuple
+from typing import Optional
 
 # Third-party imports
 import pandas as pd
@@ -66,6 +67,11 @@ def load_newts_dataframe(num_articles: Optional[int] = None,
         logger.error(f"Error reading {dataset_name} dataset: {e}")
         raise
 
+# Flat record for one NEWTS article; a NamedTuple is cheaper to build and
+# access than a per-article dict when iterating thousands of rows
+ArticleRow = namedtuple("ArticleRow", ["article_idx", "docId", "article",
+                                       "tid1", "tid2", "summary1", "summary2"])
+
 class NEWTSDataset(Dataset):
     """
     Dataset class for the NEWTS dataset.
@@ -76,17 +82,17 @@ class NEWTSDataset(Dataset):
     def __len__(self) -> int:
         return len(self.data)
 
-    def __getitem__(self, idx: int) -> Dict[str, str]:
+    def __getitem__(self, idx: int) -> ArticleRow:
         article = self.data.iloc[idx]
-        return {
-            'article': article['article'],
-            'summary1': article['summary1'],
-            'summary2': article['summary2'],
-            'article_idx': article['article_idx'],
-            'docId': article['docId'],
-            'tid1': article['tid1'],
-            'tid2': article['tid2'],
-        }
+        return ArticleRow(
+            article_idx=article['article_idx'],
+            docId=article['docId'],
+            article=article['article'],
+            tid1=article['tid1'],
+            tid2=article['tid2'],
+            summary1=article['summary1'],
+            summary2=article['summary2'],
+        )
 
 def load_newts_dataloader(num_articles: Optional[int] = None,
                           load_test_set: Optional[bool] = False,
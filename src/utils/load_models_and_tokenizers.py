@@ -41,7 +41,15 @@ def load_model_and_tokenizer(model_alias: str, device_map: Optional[str] = "auto
         logger.info(f"Loading model: {model_name} and tokenizer: {tokenizer_name}")
         
         hf_auth_token = os.getenv('HF_AUTH_TOKEN')
-        torch_dtype = torch.float16 if device.type != "cpu" else torch.float32
+        # Prefer bfloat16 on supporting GPUs: it halves activation bandwidth versus
+        # float32 while keeping the float32 exponent range, and matches the
+        # bf16 autocast used during generation
+        if device.type == "cpu":
+            torch_dtype = torch.float32
+        elif device.type == "cuda" and torch.cuda.is_bf16_supported():
+            torch_dtype = torch.bfloat16
+        else:
+            torch_dtype = torch.float16
 
         model = AutoModelForCausalLM.from_pretrained(
             pretrained_model_name_or_path=model_name,
@@ -0,0 +1,57 @@
+import random
+import unittest
+
+import numpy as np
+
+from src.evaluation.intrinsic_quality_scorer import IntrinsicQualityScorer
+
+
+def _reference_distinct_ratio(ids, n):
+    """Distinct-n via explicit tuple n-grams, used as the ground truth."""
+    num_ngrams = len(ids) - n + 1
+    if num_ngrams <= 0:
+        return 0.0
+    ngrams = {tuple(ids[k:k + n]) for k in range(num_ngrams)}
+    return len(ngrams) / num_ngrams
+
+
+class TestDistinctNgramRatio(unittest.TestCase):
+    def _ratio(self, ids, n):
+        return IntrinsicQualityScorer._distinct_ngram_ratio(
+            np.array(ids, dtype=np.int32), n)
+
+    def test_too_short_sequence(self):
+        self.assertEqual(self._ratio([], 2), 0.0)
+        self.assertEqual(self._ratio([1], 2), 0.0)
+
+    def test_all_distinct(self):
+        self.assertEqual(self._ratio([1, 2, 3, 4], 2), 1.0)
+
+    def test_fully_repeated(self):
+        # "1 1 1 1" has three bigrams, all (1, 1)
+        self.assertAlmostEqual(self._ratio([1, 1, 1, 1], 2), 1 / 3)
+
+    def test_matches_reference_on_random_sequences(self):
+        # A small vocabulary forces plenty of repeated n-grams, exercising
+        # the deduplication path of the rolling hash
+        rng = random.Random(42)
+        for _ in range(100):
+            ids = [rng.randrange(5) for _ in range(rng.randrange(1, 60))]
+            for n in (1, 2, 3, 4):
+                self.assertAlmostEqual(
+                    self._ratio(ids, n), _reference_distinct_ratio(ids, n),
+                    msg=f"Mismatch for n={n}, ids={ids}")
+
+    def test_large_ids_do_not_collide(self):
+        # Code-point sized IDs (the distinct-char path) must hash without
+        # collisions as well
+        rng = random.Random(7)
+        for _ in range(20):
+            ids = [rng.randrange(2 ** 20) for _ in range(50)]
+            for n in (2, 3):
+                self.assertAlmostEqual(
+                    self._ratio(ids, n), _reference_distinct_ratio(ids, n))
+
+
+if __name__ == '__main__':
+    unittest.main()
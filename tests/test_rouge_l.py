@@ -0,0 +1,112 @@
+import random
+import unittest
+
+import numpy as np
+from rouge_score import rouge_scorer, tokenizers
+
+from src.evaluation._rouge_l_numba import lcs_len
+from src.evaluation.extrinsic_quality_scorer import ExtrinsicQualityScorer
+
+
+def _reference_lcs_len(a, b):
+    """Naive full-table LCS dynamic program used as the ground truth."""
+    table = [[0] * (len(b) + 1) for _ in range(len(a) + 1)]
+    for i in range(1, len(a) + 1):
+        for j in range(1, len(b) + 1):
+            if a[i - 1] == b[j - 1]:
+                table[i][j] = table[i - 1][j - 1] + 1
+            else:
+                table[i][j] = max(table[i - 1][j], table[i][j - 1])
+    return table[len(a)][len(b)]
+
+
+class TestLcsLen(unittest.TestCase):
+    def _lcs(self, a, b):
+        return lcs_len(np.array(a, dtype=np.int32), np.array(b, dtype=np.int32))
+
+    def test_empty_sequences(self):
+        self.assertEqual(self._lcs([], []), 0)
+        self.assertEqual(self._lcs([1, 2, 3], []), 0)
+        self.assertEqual(self._lcs([], [1, 2, 3]), 0)
+
+    def test_identical_sequences(self):
+        self.assertEqual(self._lcs([1, 2, 3, 4], [1, 2, 3, 4]), 4)
+
+    def test_disjoint_sequences(self):
+        self.assertEqual(self._lcs([1, 2, 3], [4, 5, 6]), 0)
+
+    def test_known_subsequence(self):
+        # LCS of these is (1, 3, 5)
+        self.assertEqual(self._lcs([1, 2, 3, 4, 5], [1, 3, 5]), 3)
+
+    def test_matches_reference_on_random_sequences(self):
+        rng = random.Random(42)
+        for _ in range(100):
+            a = [rng.randrange(8) for _ in range(rng.randrange(30))]
+            b = [rng.randrange(8) for _ in range(rng.randrange(30))]
+            self.assertEqual(self._lcs(a, b), _reference_lcs_len(a, b),
+                             msg=f"Mismatch for a={a}, b={b}")
+
+
+class TestRougeLFmeasure(unittest.TestCase):
+    """Checks the hand-rolled ROUGE-L against rouge_score's implementation."""
+
+    def setUp(self):
+        self.tokenizer = tokenizers.DefaultTokenizer(use_stemmer=True)
+        self.reference_scorer = rouge_scorer.RougeScorer(['rougeL'], use_stemmer=True)
+
+    def _fmeasure(self, reference_text, generated_text):
+        # _rouge_l_fmeasure does not touch self, so it can be exercised
+        # without constructing the scorer (which would load BERTScore models)
+        return ExtrinsicQualityScorer._rouge_l_fmeasure(
+            None,
+            reference_tokens=self.tokenizer.tokenize(reference_text),
+            candidate_tokens=self.tokenizer.tokenize(generated_text))
+
+    def _assert_matches_rouge_score(self, reference_text, generated_text):
+        expected = self.reference_scorer.score(
+            target=reference_text, prediction=generated_text)['rougeL'].fmeasure
+        self.assertAlmostEqual(self._fmeasure(reference_text, generated_text),
+                               expected, places=10)
+
+    def test_identical_texts(self):
+        self._assert_matches_rouge_score(
+            "The quick brown fox jumps over the lazy dog.",
+            "The quick brown fox jumps over the lazy dog.")
+
+    def test_partial_overlap(self):
+        self._assert_matches_rouge_score(
+            "A quick brown fox jumps over the lazy dog.",
+            "The quick brown fox is fast.")
+
+    def test_paraphrase(self):
+        self._assert_matches_rouge_score(
+            "The quick brown fox jumps over the lazy dog.",
+            "The speedy brown fox leaped above the sleeping canine.")
+
+    def test_different_lengths(self):
+        self._assert_matches_rouge_score(
+            "The quick brown fox jumps over the lazy dog near the river bank.",
+            "The fox jumps.")
+
+    def test_stemming_matches(self):
+        # "jumps" vs "jumping" only match because both sides are stemmed
+        self._assert_matches_rouge_score(
+            "The fox jumps over the dog.",
+            "The fox jumping over the dog.")
+
+    def test_empty_texts(self):
+        self.assertEqual(self._fmeasure("", "some text"), 0.0)
+        self.assertEqual(self._fmeasure("some text", ""), 0.0)
+
+    def test_random_word_sequences_match_rouge_score(self):
+        rng = random.Random(7)
+        vocabulary = ["fox", "dog", "cat", "runs", "jumps", "sleeps", "quick", "lazy"]
+        for _ in range(50):
+            reference_text = " ".join(rng.choices(vocabulary, k=rng.randrange(1, 25)))
+            generated_text = " ".join(rng.choices(vocabulary, k=rng.randrange(1, 25)))
+            self._assert_matches_rouge_score(reference_text, generated_text)
+
+
+if __name__ == '__main__':
+    unittest.main()
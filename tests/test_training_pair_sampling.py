@@ -0,0 +1,88 @@
+import unittest
+from itertools import product
+
+from src.create_training_samples.create_topic_vector_training_samples import (
+    _build_interleaved_samples,
+    create_training_pairs,
+)
+
+
+class TestBuildInterleavedSamples(unittest.TestCase):
+    def test_round_robin_order(self):
+        all_samples = {1: ["a1", "a2"], 2: ["b1"], 3: ["c1", "c2", "c3"]}
+        self.assertEqual(
+            _build_interleaved_samples(all_samples),
+            [(1, "a1"), (2, "b1"), (3, "c1"), (1, "a2"), (3, "c2"), (3, "c3")])
+
+    def test_contains_every_sample_exactly_once(self):
+        all_samples = {tid: [f"s{tid}_{k}" for k in range(tid)] for tid in range(1, 6)}
+        interleaved = _build_interleaved_samples(all_samples)
+        expected = [(tid, sample) for tid, samples in all_samples.items()
+                    for sample in samples]
+        self.assertCountEqual(interleaved, expected)
+
+    def test_empty_topic_lists_are_skipped(self):
+        self.assertEqual(_build_interleaved_samples({1: [], 2: ["b1"]}), [(2, "b1")])
+        self.assertEqual(_build_interleaved_samples({}), [])
+
+
+class TestCreateTrainingPairs(unittest.TestCase):
+    def setUp(self):
+        self.all_samples = {
+            1: ["pos_a", "pos_b"],
+            2: ["neg_2a", "neg_2b"],
+            3: ["neg_3a"],
+        }
+        self.positive_samples = self.all_samples[1]
+        self.negatives = ["neg_2a", "neg_2b", "neg_3a"]
+
+    def test_returns_requested_number_of_unique_valid_pairs(self):
+        pairs = create_training_pairs(self.positive_samples, self.all_samples,
+                                      tid_positive=1, num_samples=4)
+        self.assertEqual(len(pairs), 4)
+        self.assertEqual(len(set(pairs)), 4)
+        valid_pairs = set(product(self.positive_samples, self.negatives))
+        self.assertTrue(set(pairs).issubset(valid_pairs))
+
+    def test_positive_topic_never_appears_as_negative(self):
+        pairs = create_training_pairs(self.positive_samples, self.all_samples,
+                                      tid_positive=1, num_samples=6)
+        for _, negative_sample in pairs:
+            self.assertNotIn(negative_sample, self.positive_samples)
+
+    def test_oversized_request_returns_all_pairs(self):
+        pairs = create_training_pairs(self.positive_samples, self.all_samples,
+                                      tid_positive=1, num_samples=100)
+        self.assertCountEqual(pairs, list(product(self.positive_samples, self.negatives)))
+
+    def test_subsampling_covers_the_full_pair_space(self):
+        # Repeated draws of the full pair count must always return every pair:
+        # the index-based subsampling draws without replacement
+        for _ in range(10):
+            pairs = create_training_pairs(self.positive_samples, self.all_samples,
+                                          tid_positive=1, num_samples=6)
+            self.assertCountEqual(pairs, list(product(self.positive_samples, self.negatives)))
+
+    def test_precomputed_interleaved_samples_give_same_pair_space(self):
+        interleaved = _build_interleaved_samples(self.all_samples)
+        pairs = create_training_pairs(self.positive_samples, self.all_samples,
+                                      tid_positive=1, num_samples=6,
+                                      interleaved_samples=interleaved)
+        self.assertCountEqual(pairs, list(product(self.positive_samples, self.negatives)))
+
+    def test_negative_num_samples_returns_empty_list(self):
+        self.assertEqual(
+            create_training_pairs(self.positive_samples, self.all_samples,
+                                  tid_positive=1, num_samples=-1), [])
+
+    def test_no_positive_samples_raises(self):
+        with self.assertRaises(ValueError):
+            create_training_pairs([], self.all_samples, tid_positive=1, num_samples=2)
+
+    def test_no_negative_samples_raises(self):
+        with self.assertRaises(ValueError):
+            create_training_pairs(["pos_a"], {1: ["pos_a"]}, tid_positive=1, num_samples=2)
+
+
+if __name__ == '__main__':
+    unittest.main()